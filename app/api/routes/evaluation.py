@@ -7,6 +7,7 @@ import time
 
 from app.core.database import get_db
 from app.core.security import get_current_tenant
+from app.core.usage_tracker import usage_tracker
 from app.models.tenant import Tenant
 
 
@@ -78,7 +79,13 @@ def evaluate(
     # Usage Enforcement (basic hook)
     # --------------------------------------------------------
     if tenant.pricing_plan.hard_limit:
-        if tenant.current_month_usage >= tenant.pricing_plan.request_limit:
+        # Include increments not yet flushed to Postgres
+        effective_usage = (
+            tenant.current_month_usage
+            + usage_tracker.pending_for(tenant.tenant_id)
+        )
+
+        if effective_usage >= tenant.pricing_plan.request_limit:
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail="Monthly request limit reached."
@@ -90,13 +97,9 @@ def evaluate(
     trust_score = 95.0  # TODO: replace with real trust engine call
 
     # --------------------------------------------------------
-    # Usage Increment
+    # Usage Increment (batched — no per-request UPDATE + fsync)
     # --------------------------------------------------------
-    tenant.current_month_usage += 1
-    tenant.lifetime_usage += 1
-    tenant.last_request_at = datetime.utcnow()
-
-    db.commit()
+    usage_tracker.increment(tenant.tenant_id)
 
     # --------------------------------------------------------
     # Latency Calculation
@@ -27,11 +27,11 @@ class Recommendation(str, Enum):
 class ModelInfo(BaseModel):
     provider: Optional[str] = Field(
         default=None,
-        example="openai"
+        examples=["openai"]
     )
     model: Optional[str] = Field(
         default=None,
-        example="gpt-4"
+        examples=["gpt-4"]
     )
 
 
@@ -40,21 +40,21 @@ class ModelInfo(BaseModel):
 # =====================================================
 
 class AtlasRequest(BaseModel):
-    app_name: str = Field(..., example="support-bot")
+    app_name: str = Field(..., examples=["support-bot"])
 
     user_query: str = Field(
         ...,
-        example="Can I get a refund after 90 days?"
+        examples=["Can I get a refund after 90 days?"]
     )
 
     retrieved_context: List[str] = Field(
         ...,
-        example=["Refunds are allowed within 30 days."]
+        examples=[["Refunds are allowed within 30 days."]]
     )
 
     llm_response: str = Field(
         ...,
-        example="Yes, refunds are allowed up to 120 days."
+        examples=["Yes, refunds are allowed up to 120 days."]
     )
 
     model_info: Optional[ModelInfo] = Field(
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional
 from datetime import datetime
 
@@ -22,9 +22,10 @@ class TrustConfigBase(BaseModel):
     confidence_mismatch_penalty: Optional[float] = Field(None, ge=0)
     semantic_risk_penalty: Optional[float] = Field(None, ge=0)
 
-    @validator("*", pre=True)
+    @field_validator("*", mode="before")
+    @classmethod
     def prevent_negative_values(cls, v):
-        if v is not None and v < 0:
+        if isinstance(v, (int, float)) and v < 0:
             raise ValueError("Weight values cannot be negative")
         return v
 
@@ -58,6 +59,8 @@ class TrustConfigCreate(TrustConfigBase):
 
 class TrustConfigResponse(BaseModel):
 
+    model_config = ConfigDict(from_attributes=True)  # SQLAlchemy ORM compatibility
+
     tenant_id: str
     environment: str
     is_active: bool
@@ -77,7 +80,4 @@ class TrustConfigResponse(BaseModel):
     semantic_risk_penalty: float
 
     created_at: datetime
-    updated_at: datetime
-
-    class Config:
-        from_attributes = True  # SQLAlchemy ORM compatibility
\ No newline at end of file
+    updated_at: datetime
\ No newline at end of file
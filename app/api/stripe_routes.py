@@ -1,30 +1,87 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException
 from sqlalchemy.orm import Session
-from dotenv import load_dotenv
+from threading import Lock
+from typing import Optional
+import logging
 import os
 import stripe
+import time
+import uuid
 
 from app.core.database import get_db
 from app.core.dependencies import get_current_tenant, AuthContext
+from app.core.env import (
+    STRIPE_SECRET_KEY,
+    FRONTEND_SUCCESS_URL,
+    FRONTEND_CANCEL_URL,
+)
 from app.models.tenant import Tenant
-from app.models.pricing_plan import PricingPlan
+from app.services.pricing_cache import get_plan_by_name
 from app.services.stripe_service import StripeService
 
-load_dotenv()
-
 router = APIRouter()
 
-stripe.api_key = os.getenv("STRIPE_SECRET_KEY")
+stripe.api_key = STRIPE_SECRET_KEY
+
+# ---------------------------------------------------
+# Stripe price ids, resolved once at import.
+# Missing entries surface here as one boot-time warning
+# instead of a per-request 500.
+# ---------------------------------------------------
+_KNOWN_PLAN_NAMES = ("free", "pro", "enterprise")
+
+_PRICE_IDS = {
+    name: os.environ[f"STRIPE_PRICE_{name.upper()}"]
+    for name in _KNOWN_PLAN_NAMES
+    if f"STRIPE_PRICE_{name.upper()}" in os.environ
+}
+
+for _name in _KNOWN_PLAN_NAMES:
+    if _name != "free" and _name not in _PRICE_IDS:
+        logging.getLogger("ATLAS-STRIPE").warning(
+            f"⚠ STRIPE_PRICE_{_name.upper()} not configured"
+        )
+
 
-FRONTEND_SUCCESS_URL = os.getenv(
-    "STRIPE_SUCCESS_URL",
-    "http://localhost:3000/success"
-)
+# ---------------------------------------------------
+# Checkout retry cache. Browsers re-fire this endpoint
+# on flaky connections; replaying the cached response
+# skips a ~200ms Stripe call per retry. Stripe's own
+# idempotency_key guarantees correctness regardless.
+# ---------------------------------------------------
+CHECKOUT_CACHE_TTL_SECONDS = 300
+CHECKOUT_CACHE_MAX_SIZE = int(os.getenv("CHECKOUT_CACHE_MAX_SIZE", 1_000))
 
-FRONTEND_CANCEL_URL = os.getenv(
-    "STRIPE_CANCEL_URL",
-    "http://localhost:3000/cancel"
-)
+_checkout_cache: dict = {}
+_checkout_cache_lock = Lock()
+
+
+def _cached_checkout(cache_key):
+    with _checkout_cache_lock:
+        entry = _checkout_cache.get(cache_key)
+
+        if entry is None:
+            return None
+
+        response, cached_at = entry
+
+        if time.time() - cached_at > CHECKOUT_CACHE_TTL_SECONDS:
+            del _checkout_cache[cache_key]
+            return None
+
+        return response
+
+
+def _store_checkout(cache_key, response):
+    with _checkout_cache_lock:
+        _checkout_cache[cache_key] = (response, time.time())
+
+        # Expired entries are only reaped on re-read, so unique
+        # Idempotency-Keys would pile up for the process lifetime.
+        # Bound the dict by evicting oldest insertions when full,
+        # same as AuthCache (dicts preserve insertion order).
+        while len(_checkout_cache) > CHECKOUT_CACHE_MAX_SIZE:
+            del _checkout_cache[next(iter(_checkout_cache))]
 
 
 # ===================================================
@@ -35,10 +92,19 @@ def create_checkout(
     plan: str,
     auth: AuthContext = Depends(get_current_tenant),
     db: Session = Depends(get_db),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
 ):
 
     tenant_id = auth.tenant_id
 
+    # ---------------------------------------------------
+    # 0️⃣ Replay Retried Requests
+    # ---------------------------------------------------
+    if idempotency_key:
+        cached = _cached_checkout((tenant_id, plan, idempotency_key))
+        if cached is not None:
+            return cached
+
     # ---------------------------------------------------
     # 1️⃣ Validate Tenant
     # ---------------------------------------------------
@@ -52,12 +118,9 @@ def create_checkout(
         raise HTTPException(status_code=403, detail="Tenant inactive")
 
     # ---------------------------------------------------
-    # 2️⃣ Validate Plan Exists in DB
+    # 2️⃣ Validate Plan Exists (cached)
     # ---------------------------------------------------
-    pricing_plan = db.query(PricingPlan).filter(
-        PricingPlan.name == plan,
-        PricingPlan.is_active == True
-    ).first()
+    pricing_plan = get_plan_by_name(db, plan)
 
     if not pricing_plan:
         raise HTTPException(status_code=400, detail="Invalid plan selected")
@@ -70,9 +133,9 @@ def create_checkout(
         )
 
     # ---------------------------------------------------
-    # 3️⃣ Resolve Stripe Price ID
+    # 3️⃣ Resolve Stripe Price ID (import-time dict)
     # ---------------------------------------------------
-    price_id = os.getenv(f"STRIPE_PRICE_{plan.upper()}")
+    price_id = _PRICE_IDS.get(plan)
 
     if not price_id:
         raise HTTPException(
@@ -116,7 +179,8 @@ def create_checkout(
             metadata={
                 "tenant_id": tenant.tenant_id,
                 "plan": plan
-            }
+            },
+            idempotency_key=idempotency_key or str(uuid.uuid4()),
         )
 
     except Exception as e:
@@ -125,8 +189,13 @@ def create_checkout(
             detail=f"Stripe checkout failed: {str(e)}"
         )
 
-    return {
+    response = {
         "checkout_url": session.url,
         "session_id": session.id,
         "plan": plan
-    }
\ No newline at end of file
+    }
+
+    if idempotency_key:
+        _store_checkout((tenant_id, plan, idempotency_key), response)
+
+    return response
\ No newline at end of file
@@ -1,31 +1,89 @@
+import hashlib
+import hmac
+import logging
 import os
+import time
+
+import orjson
 import stripe
-import logging
 
-from fastapi import APIRouter, Request, HTTPException, Depends
+from fastapi import APIRouter, BackgroundTasks, Request, HTTPException
 from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
-from dotenv import load_dotenv
+from sqlalchemy import bindparam, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
-from app.core.database import get_db
+from app.core.auth_cache import auth_cache, tenant_auth_cache
+from app.core.database import SessionLocal
+from app.core.env import STRIPE_SECRET_KEY, STRIPE_WEBHOOK_SECRET
 from app.models.tenant import Tenant
-from app.models.pricing_plan import PricingPlan
+from app.services.pricing_cache import get_plan_by_name, get_plan_by_price_id
+from app.models.processed_stripe_event import ProcessedStripeEvent
 
 # ===================================================
 # Setup
 # ===================================================
 
-load_dotenv()
-
 router = APIRouter()
 logger = logging.getLogger("ATLAS-STRIPE")
 
-stripe.api_key = os.getenv("STRIPE_SECRET_KEY")
-WEBHOOK_SECRET = os.getenv("STRIPE_WEBHOOK_SECRET")
+stripe.api_key = STRIPE_SECRET_KEY
+WEBHOOK_SECRET = STRIPE_WEBHOOK_SECRET
 
 if not WEBHOOK_SECRET:
     logger.warning("⚠ STRIPE_WEBHOOK_SECRET not configured")
 
+# Escape hatch back to the SDK verifier in case of signature-scheme skew
+USE_SDK_VERIFY = os.getenv("STRIPE_SDK_VERIFY", "false").lower() == "true"
+
+SIGNATURE_TOLERANCE_SECONDS = 300
+
+# The secret never changes for process lifetime, so the HMAC key
+# schedule is computed once and copied per event instead of rebuilt.
+_HMAC_TEMPLATE = (
+    hmac.new(WEBHOOK_SECRET.encode("utf-8"), digestmod=hashlib.sha256)
+    if WEBHOOK_SECRET else None
+)
+
+
+def _verify_and_parse(payload: bytes, sig_header: str) -> dict:
+    """
+    Verifies Stripe's v1 signature scheme and parses the event.
+
+    Same checks as stripe.Webhook.construct_event (timestamp
+    tolerance, constant-time digest compare) minus the per-call
+    key-schedule rebuild.
+    """
+
+    if not sig_header or _HMAC_TEMPLATE is None:
+        raise ValueError("Missing signature header or secret")
+
+    timestamp = None
+    candidates = []
+
+    for element in sig_header.split(","):
+        name, _, value = element.strip().partition("=")
+        if name == "t":
+            timestamp = value
+        elif name == "v1":
+            candidates.append(value)
+
+    if timestamp is None or not candidates:
+        raise ValueError("Malformed signature header")
+
+    if abs(time.time() - int(timestamp)) > SIGNATURE_TOLERANCE_SECONDS:
+        raise ValueError("Signature timestamp outside tolerance")
+
+    mac = _HMAC_TEMPLATE.copy()
+    mac.update(timestamp.encode("ascii"))
+    mac.update(b".")
+    mac.update(payload)
+    expected = mac.hexdigest()
+
+    if not any(hmac.compare_digest(expected, c) for c in candidates):
+        raise ValueError("Signature mismatch")
+
+    return orjson.loads(payload)
+
 
 # ===================================================
 # 🔔 STRIPE WEBHOOK ENDPOINT
@@ -33,10 +91,14 @@ if not WEBHOOK_SECRET:
 @router.post("/stripe/webhook", response_model=None)
 async def stripe_webhook(
     request: Request,
-    db: Session = Depends(get_db),
+    background_tasks: BackgroundTasks,
 ):
     """
-    Handles Stripe subscription lifecycle events.
+    Verifies the Stripe signature and defers event processing.
+
+    Stripe retries on slow responses, so the handler returns 200 as
+    soon as the signature checks out; DB work and any Stripe API calls
+    run in a background task with their own session.
 
     Events handled:
     - checkout.session.completed
@@ -53,12 +115,15 @@ async def stripe_webhook(
     # Verify Signature
     # ===================================================
     try:
-        event = stripe.Webhook.construct_event(
-            payload,
-            sig_header,
-            WEBHOOK_SECRET,
-        )
-    except stripe.error.SignatureVerificationError:
+        if USE_SDK_VERIFY:
+            event = stripe.Webhook.construct_event(
+                payload,
+                sig_header,
+                WEBHOOK_SECRET,
+            )
+        else:
+            event = _verify_and_parse(payload, sig_header)
+    except (ValueError, stripe.error.SignatureVerificationError):
         logger.warning("Invalid Stripe signature")
         raise HTTPException(status_code=400, detail="Invalid signature")
     except Exception as e:
@@ -70,26 +135,97 @@ async def stripe_webhook(
 
     logger.info(f"Stripe event received: {event_type}")
 
-    # ===================================================
-    # 🟢 CHECKOUT COMPLETED
-    # ===================================================
-    if event_type == "checkout.session.completed":
+    # Deduplication happens inside the background task, in the same
+    # transaction as the state change — claiming here would mark the
+    # event processed even if processing never runs.
+    background_tasks.add_task(
+        process_stripe_event, event["id"], event_type, data
+    )
+
+    return JSONResponse({"status": "queued"})
+
+
+# ===================================================
+# 📇 TENANT LOOKUP (prepared statements)
+# ===================================================
+# Built once at import so every webhook branch reuses the same
+# expression graph and hits SQLAlchemy's compiled-statement cache.
+_tenant_by_customer_stmt = select(Tenant).where(
+    Tenant.stripe_customer_id == bindparam("cid")
+)
+
+def _get_tenant_by_customer(db, customer_id):
+    return db.execute(
+        _tenant_by_customer_stmt, {"cid": customer_id}
+    ).scalar_one_or_none()
+
+
+# ===================================================
+# 🔒 EVENT DEDUPLICATION
+# ===================================================
+def claim_stripe_event(db, event_id: str) -> bool:
+    """
+    Claim a Stripe event id inside the caller's open transaction.
+
+    No commit happens here: the claim row commits (or rolls back)
+    together with the tenant state change it guards, so a failed
+    processing attempt leaves the event unclaimed and Stripe's retry
+    gets another shot. Returns False when an earlier delivery already
+    committed the claim.
+    """
+
+    result = db.execute(
+        pg_insert(ProcessedStripeEvent)
+        .values(event_id=event_id)
+        .on_conflict_do_nothing()
+    )
+    return result.rowcount > 0
+
+
+# ===================================================
+# ⚙️ EVENT PROCESSOR (Background)
+# ===================================================
+def process_stripe_event(event_id: str, event_type: str, data: dict) -> None:
+    """
+    Applies a verified Stripe event to tenant state.
+    Runs outside the request path with its own session.
+
+    The idempotency claim is taken here, in the same transaction as
+    the tenant update: either both commit or neither does. A crash or
+    error mid-processing rolls the claim back too, so Stripe's retry
+    is processed instead of being answered as a duplicate of an event
+    that never actually applied.
+    """
+
+    db = SessionLocal()
 
-        customer_id = data.get("customer")
-        subscription_id = data.get("subscription")
+    try:
+        # ===================================================
+        # Idempotency Gate (first committed processing wins)
+        # ===================================================
+        if not claim_stripe_event(db, event_id):
+            logger.info(f"Stripe event already processed: {event_id}")
+            return
+
+        # ===================================================
+        # 🟢 CHECKOUT COMPLETED
+        # ===================================================
+        if event_type == "checkout.session.completed":
 
-        tenant = db.query(Tenant).filter(
-            Tenant.stripe_customer_id == customer_id
-        ).first()
+            customer_id = data.get("customer")
+            subscription_id = data.get("subscription")
 
-        if tenant and subscription_id:
-            try:
-                subscription = stripe.Subscription.retrieve(subscription_id)
-                price_id = subscription["items"]["data"][0]["price"]["id"]
+            tenant = _get_tenant_by_customer(db, customer_id)
 
-                plan = db.query(PricingPlan).filter(
-                    PricingPlan.stripe_price_id == price_id
-                ).first()
+            if tenant and subscription_id:
+                # Plan name travels in the session metadata we set at
+                # checkout creation — no need to fetch the subscription
+                # back from Stripe just to learn its price.
+                plan_name = (data.get("metadata") or {}).get("plan")
+
+                plan = None
+                if plan_name:
+                    plan = get_plan_by_name(db, plan_name)
 
                 if plan:
                     tenant.plan = plan.name
@@ -100,84 +236,88 @@ async def stripe_webhook(
                     db.commit()
                     logger.info(f"Tenant {tenant.tenant_id} upgraded to {plan.name}")
 
-            except Exception as e:
-                logger.exception(f"Subscription activation error: {str(e)}")
+        # ===================================================
+        # 🔄 SUBSCRIPTION UPDATED
+        # ===================================================
+        elif event_type == "customer.subscription.updated":
 
-    # ===================================================
-    # 🔄 SUBSCRIPTION UPDATED
-    # ===================================================
-    elif event_type == "customer.subscription.updated":
+            customer_id = data.get("customer")
+            price_id = data["items"]["data"][0]["price"]["id"]
+
+            tenant = _get_tenant_by_customer(db, customer_id)
+
+            if tenant:
+                plan = get_plan_by_price_id(db, price_id)
+
+                if plan:
+                    tenant.plan = plan.name
+                    tenant.monthly_request_limit = plan.request_limit
+                    db.commit()
+                    logger.info(f"Tenant {tenant.tenant_id} plan updated")
 
-        customer_id = data.get("customer")
-        price_id = data["items"]["data"][0]["price"]["id"]
+        # ===================================================
+        # 🔴 SUBSCRIPTION CANCELLED
+        # ===================================================
+        elif event_type == "customer.subscription.deleted":
 
-        tenant = db.query(Tenant).filter(
-            Tenant.stripe_customer_id == customer_id
-        ).first()
+            customer_id = data.get("customer")
 
-        if tenant:
-            plan = db.query(PricingPlan).filter(
-                PricingPlan.stripe_price_id == price_id
-            ).first()
+            tenant = _get_tenant_by_customer(db, customer_id)
 
-            if plan:
-                tenant.plan = plan.name
-                tenant.monthly_request_limit = plan.request_limit
+            if tenant:
+                tenant.plan = "free"
+                tenant.monthly_request_limit = 1000
+                tenant.stripe_subscription_id = None
+                tenant.is_suspended = False
                 db.commit()
-                logger.info(f"Tenant {tenant.tenant_id} plan updated")
 
-    # ===================================================
-    # 🔴 SUBSCRIPTION CANCELLED
-    # ===================================================
-    elif event_type == "customer.subscription.deleted":
+                auth_cache.invalidate_tenant(tenant.tenant_id)
+                tenant_auth_cache.invalidate_tenant(tenant.tenant_id)
 
-        customer_id = data.get("customer")
+                logger.info(f"Tenant {tenant.tenant_id} downgraded to free")
 
-        tenant = db.query(Tenant).filter(
-            Tenant.stripe_customer_id == customer_id
-        ).first()
+        # ===================================================
+        # 🔴 PAYMENT FAILED → SUSPEND
+        # ===================================================
+        elif event_type == "invoice.payment_failed":
 
-        if tenant:
-            tenant.plan = "free"
-            tenant.monthly_request_limit = 1000
-            tenant.stripe_subscription_id = None
-            tenant.is_suspended = False
-            db.commit()
+            customer_id = data.get("customer")
 
-            logger.info(f"Tenant {tenant.tenant_id} downgraded to free")
+            tenant = _get_tenant_by_customer(db, customer_id)
 
-    # ===================================================
-    # 🔴 PAYMENT FAILED → SUSPEND
-    # ===================================================
-    elif event_type == "invoice.payment_failed":
+            if tenant:
+                tenant.is_suspended = True
+                db.commit()
 
-        customer_id = data.get("customer")
+                # Suspension must take effect before cached auth expires
+                auth_cache.invalidate_tenant(tenant.tenant_id)
+                tenant_auth_cache.invalidate_tenant(tenant.tenant_id)
 
-        tenant = db.query(Tenant).filter(
-            Tenant.stripe_customer_id == customer_id
-        ).first()
+                logger.warning(f"Tenant {tenant.tenant_id} suspended due to failed payment")
 
-        if tenant:
-            tenant.is_suspended = True
-            db.commit()
+        # ===================================================
+        # 🟢 PAYMENT SUCCEEDED → REACTIVATE
+        # ===================================================
+        elif event_type == "invoice.payment_succeeded":
 
-            logger.warning(f"Tenant {tenant.tenant_id} suspended due to failed payment")
+            customer_id = data.get("customer")
 
-    # ===================================================
-    # 🟢 PAYMENT SUCCEEDED → REACTIVATE
-    # ===================================================
-    elif event_type == "invoice.payment_succeeded":
+            tenant = _get_tenant_by_customer(db, customer_id)
 
-        customer_id = data.get("customer")
+            if tenant:
+                tenant.is_suspended = False
+                db.commit()
 
-        tenant = db.query(Tenant).filter(
-            Tenant.stripe_customer_id == customer_id
-        ).first()
+                logger.info(f"Tenant {tenant.tenant_id} reactivated")
 
-        if tenant:
-            tenant.is_suspended = False
-            db.commit()
+        # Events that needed no state change (unknown type, no matching
+        # tenant) still commit their claim so redeliveries stay cheap.
+        # For the branches above this re-commit is a no-op.
+        db.commit()
 
-            logger.info(f"Tenant {tenant.tenant_id} reactivated")
+    except Exception:
+        db.rollback()
+        logger.exception(f"Stripe event processing failed: {event_type}")
 
-    return JSONResponse({"status": "success"})
\ No newline at end of file
+    finally:
+        db.close()
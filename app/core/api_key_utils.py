@@ -12,7 +12,9 @@ Design Goals:
 - Rotation-friendly
 """
 
+import base64
 import hashlib
+import os
 import secrets
 from typing import Tuple
 
@@ -27,6 +29,20 @@ TEST_ENV_PREFIX = "test"
 
 KEY_LENGTH_BYTES = 32  # 256-bit entropy
 
+# Full literal prefixes, precomputed so key assembly is one concat.
+# Both are exactly 11 chars, which the 20-char key_prefix invariant
+# below depends on: 11 literal + 9 random (~54 bits of entropy).
+_KEY_PREFIX_LITERAL = {
+    "live": f"{DEFAULT_PREFIX}_{LIVE_ENV_PREFIX}_",
+    "test": f"{DEFAULT_PREFIX}_{TEST_ENV_PREFIX}_",
+}
+
+KEY_PREFIX_LENGTH = 20
+
+# Hash scheme version tag. v2 = blake2b; untagged hashes are legacy
+# sha256 rows that verify through the fallback path below.
+HASH_VERSION_PREFIX = "v2$"
+
 
 # ============================================================
 # API KEY GENERATION
@@ -43,18 +59,25 @@ def generate_api_key(environment: str = "live") -> Tuple[str, str]:
         atlas_live_abcd1234....
     """
 
-    if environment not in {"live", "test"}:
-        raise ValueError("Environment must be 'live' or 'test'")
+    prefix_literal = _KEY_PREFIX_LITERAL.get(environment)
 
-    env_prefix = LIVE_ENV_PREFIX if environment == "live" else TEST_ENV_PREFIX
+    if prefix_literal is None:
+        raise ValueError("Environment must be 'live' or 'test'")
 
-    # Strong cryptographic randomness
-    random_part = secrets.token_urlsafe(KEY_LENGTH_BYTES)
+    # Same CSPRNG as secrets.token_urlsafe, without its per-call
+    # wrapper overhead — this runs in loops during bulk provisioning
+    random_part = base64.urlsafe_b64encode(
+        os.urandom(KEY_LENGTH_BYTES)
+    ).rstrip(b"=").decode("ascii")
 
-    raw_key = f"{DEFAULT_PREFIX}_{env_prefix}_{random_part}"
+    raw_key = prefix_literal + random_part
 
-    # Prefix stored in DB (for quick identification in UI/logs)
-    key_prefix = raw_key[:20]
+    # Prefix stored in DB (for quick identification in UI/logs).
+    # Built from parts rather than sliced from raw_key so the literal
+    # never gets cut mid-word and the random tail is always 9 chars —
+    # the partial unique index on key_prefix relies on this shape.
+    key_prefix = prefix_literal + random_part[:9]
+    assert len(key_prefix) == KEY_PREFIX_LENGTH
 
     return raw_key, key_prefix
 
@@ -65,13 +88,29 @@ def generate_api_key(environment: str = "live") -> Tuple[str, str]:
 
 def hash_api_key(api_key: str) -> str:
     """
-    One-way SHA-256 hash of API key.
+    One-way blake2b hash of API key (version-tagged).
     Only hashed value should be stored in DB.
+
+    blake2b is ~2-3x faster than sha256 on short inputs and is
+    cryptographically sufficient here: the key carries 256 bits of
+    entropy, so this is not a password KDF scenario.
     """
 
     if not api_key:
         raise ValueError("API key cannot be empty")
 
+    digest = hashlib.blake2b(
+        api_key.encode("utf-8"), digest_size=32
+    ).hexdigest()
+
+    return HASH_VERSION_PREFIX + digest
+
+
+def _legacy_hash_api_key(api_key: str) -> str:
+    """
+    SHA-256 hash for rows created before the v2 scheme.
+    """
+
     return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
 
 
@@ -82,9 +121,13 @@ def hash_api_key(api_key: str) -> str:
 def verify_api_key(raw_key: str, stored_hash: str) -> bool:
     """
     Secure comparison of provided API key against stored hash.
+    Supports both v2 (blake2b) and legacy (sha256) stored hashes.
     """
 
-    computed_hash = hash_api_key(raw_key)
+    if stored_hash.startswith(HASH_VERSION_PREFIX):
+        computed_hash = hash_api_key(raw_key)
+    else:
+        computed_hash = _legacy_hash_api_key(raw_key)
 
     # Prevent timing attacks
     return secrets.compare_digest(computed_hash, stored_hash)
@@ -0,0 +1,106 @@
+"""
+ATLAS Auth Cache
+----------------
+
+Short-TTL in-process cache for verified API keys.
+
+The auth dependencies hash the incoming key and hit Postgres on every
+request even though keys repeat for the lifetime of a client. Caching
+the verified result turns the >99% repeat-key case into a dict lookup
+— no SHA hash, no SELECTs.
+
+Notes:
+- Keyed by a blake2b digest of the raw key (cache key only, never
+  stored or compared for auth).
+- Entries expire after a short TTL so revocations and suspensions
+  propagate quickly; tenant-level invalidation hooks cover the
+  webhook-driven status changes.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+class AuthCache:
+    """
+    Thread-safe TTL cache for auth results.
+    """
+
+    MAX_SIZE = int(os.getenv("AUTH_CACHE_MAX_SIZE", 10_000))
+    TTL_SECONDS = float(os.getenv("AUTH_CACHE_TTL_SECONDS", "30"))
+
+    def __init__(self):
+        # key → (value, tenant_id, timestamp)
+        self._cache: Dict[bytes, Tuple[Any, str, float]] = {}
+        self._lock = threading.Lock()
+
+    # -----------------------------------------------------
+    # Cache Key Derivation
+    # -----------------------------------------------------
+    @staticmethod
+    def key_for(raw_api_key: str) -> bytes:
+        return hashlib.blake2b(
+            raw_api_key.encode("utf-8"), digest_size=16
+        ).digest()
+
+    # -----------------------------------------------------
+    # GET / SET
+    # -----------------------------------------------------
+    def get(self, key: bytes) -> Optional[Any]:
+        now = time.time()
+
+        with self._lock:
+            entry = self._cache.get(key)
+
+            if not entry:
+                return None
+
+            value, _, timestamp = entry
+
+            if (now - timestamp) > self.TTL_SECONDS:
+                self._cache.pop(key, None)
+                return None
+
+            return value
+
+    def set(self, key: bytes, value: Any, tenant_id: str) -> None:
+        with self._lock:
+            self._cache[key] = (value, tenant_id, time.time())
+
+            # Evict oldest insertions when full (dicts preserve order)
+            while len(self._cache) > self.MAX_SIZE:
+                self._cache.pop(next(iter(self._cache)))
+
+    # -----------------------------------------------------
+    # Invalidation
+    # -----------------------------------------------------
+    def invalidate_tenant(self, tenant_id: str) -> None:
+        """
+        Drop every cached entry for a tenant.
+        Used when key rotation or webhook events change tenant status.
+        """
+        with self._lock:
+            stale = [
+                key for key, (_, cached_tenant, _) in self._cache.items()
+                if cached_tenant == tenant_id
+            ]
+            for key in stale:
+                self._cache.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+# ---------------------------------------------------------
+# Global Singleton Instances
+# ---------------------------------------------------------
+
+# AuthContext results for app/core/dependencies.py
+auth_cache = AuthCache()
+
+# Tenant results for app/core/security.py
+tenant_auth_cache = AuthCache()
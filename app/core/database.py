@@ -1,16 +1,16 @@
 import os
 import logging
 from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from sqlalchemy.exc import OperationalError
-from dotenv import load_dotenv
+
+import app.core.env  # noqa: F401  (parses .env exactly once)
 
 # =====================================================
-# 🌍 Load Environment Variables
+# 🌍 Environment
 # =====================================================
 
-load_dotenv()
-
 DATABASE_URL = os.getenv("DATABASE_URL")
 ENVIRONMENT = os.getenv("ENVIRONMENT", "development").lower()
 
@@ -19,7 +19,7 @@ if not DATABASE_URL:
         "❌ DATABASE_URL is not set. Check your .env file."
     )
 
-print(f"📦 DATABASE_URL: {DATABASE_URL}")
+logger = logging.getLogger("ATLAS-DB")
 
 # =====================================================
 # 🏗️ SQLAlchemy Engine (Production-Ready Config)
@@ -29,31 +29,81 @@ engine = create_engine(
     DATABASE_URL,
 
     # ---- Connection Pool ----
-    pool_size=10,
+    # Sized to the sync-route threadpool (40 threads); a smaller pool
+    # makes checkout the hidden wait under burst traffic. LIFO keeps
+    # the hottest connections (and Postgres-side caches) warm.
+    pool_size=40,
     max_overflow=20,
+    pool_timeout=5,            # Fail fast instead of queueing forever
+    pool_use_lifo=True,
     pool_pre_ping=True,        # Auto reconnect dead connections
     pool_recycle=1800,         # Recycle every 30 mins
 
+    # ---- Statement Cache ----
+    # Room for every hot statement variant; default (500) can thrash
+    # once per-tenant analytics queries join the working set
+    query_cache_size=1200,
+
     # ---- Debugging ----
     echo=False,                # Set True only for deep SQL debug
     future=True
 )
 
 # =====================================================
-# 🔎 Verify Actual Connected Database (CRITICAL)
+# 🔎 Verify Actual Connected Database (DEV ONLY)
+# =====================================================
+# A blocking SELECT at import added a round trip to every worker's
+# cold start; production relies on check_database_connection() via
+# the readiness probe instead.
+
+if ENVIRONMENT == "development":
+    try:
+        with engine.connect() as conn:
+            current_db = conn.execute(
+                text("SELECT current_database()")
+            ).scalar()
+
+            logger.info(f"🔥 Connected database: {current_db}")
+
+    except Exception:
+        logger.exception("Failed to connect during engine verification.")
+
+
+# =====================================================
+# ⚡ Async Engine (asyncpg)
 # =====================================================
+# Async read endpoints scale with the connection pool instead of the
+# sync threadpool's hard thread ceiling. Write paths that depend on
+# sync sessions (background log writer, usage flush, engines) stay on
+# the sync engine above.
 
-try:
-    with engine.connect() as conn:
-        current_db = conn.execute(
-            text("SELECT current_database()")
-        ).scalar()
+ASYNC_DATABASE_URL = DATABASE_URL.replace(
+    "postgresql://", "postgresql+asyncpg://", 1
+)
 
-        print(f"🔥 ACTUAL CONNECTED DATABASE: {current_db}")
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_size=10,
+    max_overflow=20,
 
-except Exception as e:
-    print("❌ Failed to connect during engine verification.")
-    raise e
+    # pre_ping costs a round trip per checkout; recycle handles stale
+    # connections instead. asyncpg's statement cache gives server-side
+    # plan reuse for the short repeated queries on the hot paths.
+    pool_pre_ping=False,
+    pool_recycle=1800,
+    connect_args={
+        "statement_cache_size": 1024,
+        "prepared_statement_cache_size": 1024,
+    },
+
+    echo=False,
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 
 # =====================================================
@@ -86,6 +136,11 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 # =====================================================
 # 🏥 Database Health Check
 # =====================================================
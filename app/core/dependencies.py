@@ -1,24 +1,44 @@
+import hmac
+import os
+
 from fastapi import Header, HTTPException, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import Session, joinedload
 from typing import Optional
 from datetime import datetime
-import hmac
 
+from app.core.auth_cache import auth_cache
 from app.core.database import get_db
 from app.models.api_key import TenantAPIKey
 from app.models.tenant import Tenant
-from app.core.security import hash_api_key
+from app.core.api_key_utils import verify_api_key
+
+# Prepared once at import so repeat auth calls hit the compiled-
+# statement cache instead of regenerating SQL.
+_stmt_key_with_tenant = (
+    select(TenantAPIKey)
+    .options(joinedload(TenantAPIKey.tenant))
+    .where(
+        TenantAPIKey.key_prefix == bindparam("prefix"),
+        TenantAPIKey.is_active.is_(True),
+        TenantAPIKey.is_revoked.is_(False),
+    )
+)
 
 
 class AuthContext:
     """
     Structured authentication context.
     Returned to endpoints after successful validation.
+
+    Carries the already-fetched Tenant row so endpoints don't issue
+    a second SELECT for the same tenant in the request.
     """
 
-    def __init__(self, tenant_id: str, api_key_id: int):
+    def __init__(self, tenant_id: str, api_key_id: int, tenant: Tenant = None):
         self.tenant_id = tenant_id
         self.api_key_id = api_key_id
+        self.tenant = tenant
 
 
 # ======================================================
@@ -36,26 +56,30 @@ def get_current_tenant(
         )
 
     # --------------------------------------------------
-    # Hash Incoming Key
+    # Cache Check (skips hash + both SELECTs on repeat keys)
     # --------------------------------------------------
-    hashed_input = hash_api_key(x_api_key)
+    cache_key = auth_cache.key_for(x_api_key)
+    cached = auth_cache.get(cache_key)
+
+    if cached is not None:
+        return cached
 
     # --------------------------------------------------
-    # Lookup Key Record
+    # Lookup Key Record (indexed prefix, single row)
     # --------------------------------------------------
-    key_record = db.query(TenantAPIKey).filter(
-        TenantAPIKey.is_active == True
-    ).all()
-
-    # Use constant-time comparison
-    matched_key = None
-
-    for record in key_record:
-        if hmac.compare_digest(record.api_key_hash, hashed_input):
-            matched_key = record
-            break
-
-    if not matched_key:
+    # The old path fetched every active key and compared hashes in a
+    # Python loop — O(N) row transfer per request. The indexed prefix
+    # narrows it to one candidate, and joinedload pulls the tenant in
+    # the same round trip.
+    matched_key = db.execute(
+        _stmt_key_with_tenant, {"prefix": x_api_key[:20]}
+    ).scalars().first()
+
+    # Constant-time comparison against the single candidate
+    # (verify_api_key handles both v2 and legacy hash schemes)
+    if not matched_key or not verify_api_key(
+        x_api_key, matched_key.api_key_hash
+    ):
         raise HTTPException(
             status_code=401,
             detail="Invalid API key"
@@ -72,20 +96,50 @@ def get_current_tenant(
             )
 
     # --------------------------------------------------
-    # Validate Tenant Status
+    # Validate Tenant Status (already joined)
     # --------------------------------------------------
-    tenant = db.query(Tenant).filter(
-        Tenant.tenant_id == matched_key.tenant_id,
-        Tenant.is_active == True
-    ).first()
+    tenant = matched_key.tenant
 
-    if not tenant:
+    if not tenant or not tenant.is_active:
         raise HTTPException(
             status_code=403,
             detail="Tenant inactive or suspended"
         )
 
-    return AuthContext(
+    context = AuthContext(
         tenant_id=tenant.tenant_id,
-        api_key_id=matched_key.id
-    )
\ No newline at end of file
+        api_key_id=matched_key.id,
+        tenant=tenant
+    )
+
+    auth_cache.set(cache_key, context, tenant_id=tenant.tenant_id)
+
+    return context
+
+
+# ======================================================
+# 🛡 Admin Authentication Dependency
+# ======================================================
+
+ADMIN_API_KEY = os.getenv("ADMIN_API_KEY")
+
+
+def require_admin(
+    x_admin_key: Optional[str] = Header(None, alias="X-Admin-Key"),
+) -> None:
+    """
+    Gate for operational endpoints that mutate state across tenants.
+
+    Fails closed: if ADMIN_API_KEY is not configured, the endpoint
+    is unavailable rather than open to anyone.
+    """
+
+    if (
+        not ADMIN_API_KEY
+        or not x_admin_key
+        or not hmac.compare_digest(x_admin_key, ADMIN_API_KEY)
+    ):
+        raise HTTPException(
+            status_code=403,
+            detail="Admin access required"
+        )
\ No newline at end of file
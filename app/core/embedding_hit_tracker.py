@@ -0,0 +1,118 @@
+import os
+import time
+from threading import Lock
+from typing import Dict, Iterable
+
+from sqlalchemy import text
+
+
+class EmbeddingHitTracker:
+    """
+    In-process hit counter for the embedding cache with batched flush.
+
+    Bumping hit_count / last_accessed inline would turn every cache
+    *read* into a row UPDATE plus commit fsync — exactly the write
+    the cache exists to avoid. Instead, hits accumulate in memory and
+    flush as one executemany every few seconds, off the lookup path.
+    last_accessed therefore lags by at most the flush interval, which
+    is fine for its only consumer (LRU-style cleanup jobs).
+
+    Features:
+    - Per-hash pending counters
+    - Flush on interval or threshold
+    - Atomic SQL increments (no read-modify-write races)
+    - Thread-safe
+    """
+
+    FLUSH_INTERVAL_SECONDS = float(
+        os.getenv("EMBEDDING_HIT_FLUSH_INTERVAL_SECONDS", "5")
+    )
+    FLUSH_THRESHOLD = int(os.getenv("EMBEDDING_HIT_FLUSH_THRESHOLD", "200"))
+
+    _FLUSH_SQL = text(
+        "UPDATE embedding_cache "
+        "SET hit_count = hit_count + :delta, last_accessed = now() "
+        "WHERE content_hash = :content_hash"
+    )
+
+    def __init__(self):
+        self.pending: Dict[str, int] = {}
+        self.last_flush = time.time()
+        self.lock = Lock()
+
+    # -----------------------------------------------------
+    # Record Cache Hits
+    # -----------------------------------------------------
+    def record_hits(self, content_hashes: Iterable[str]) -> None:
+        """
+        Record one hit per content hash. Cheap enough to call inline
+        from the lookup path — no DB work happens here.
+        """
+
+        with self.lock:
+            for content_hash in content_hashes:
+                self.pending[content_hash] = (
+                    self.pending.get(content_hash, 0) + 1
+                )
+
+            should_flush = (
+                len(self.pending) >= self.FLUSH_THRESHOLD
+                or (time.time() - self.last_flush) >= self.FLUSH_INTERVAL_SECONDS
+            )
+
+        if should_flush:
+            self.flush()
+
+    # -----------------------------------------------------
+    # Flush to Postgres
+    # -----------------------------------------------------
+    def flush(self) -> int:
+        """
+        Flush all pending counters as one executemany UPDATE.
+        Returns number of rows flushed.
+        """
+
+        with self.lock:
+            if not self.pending:
+                self.last_flush = time.time()
+                return 0
+
+            batch = self.pending
+            self.pending = {}
+            self.last_flush = time.time()
+
+        # Imported here to avoid a circular import at module load
+        from app.core.database import SessionLocal
+
+        db = SessionLocal()
+        try:
+            db.execute(
+                self._FLUSH_SQL,
+                [
+                    {"content_hash": content_hash, "delta": delta}
+                    for content_hash, delta in batch.items()
+                ],
+            )
+            db.commit()
+            return len(batch)
+
+        except Exception:
+            db.rollback()
+
+            # Re-queue so counts are not lost on a transient DB error
+            with self.lock:
+                for content_hash, delta in batch.items():
+                    self.pending[content_hash] = (
+                        self.pending.get(content_hash, 0) + delta
+                    )
+
+            return 0
+
+        finally:
+            db.close()
+
+
+# ---------------------------------------------------------
+# Global Singleton Instance
+# ---------------------------------------------------------
+embedding_hit_tracker = EmbeddingHitTracker()
@@ -0,0 +1,105 @@
+import os
+import time
+from threading import Lock
+from typing import Dict, List
+
+
+class EmbeddingWriteBehind:
+    """
+    Write-behind queue for the embedding_cache table.
+
+    Persisting a freshly computed embedding issued an INSERT + commit
+    on the request path, right after the embedding RPC the caller was
+    already waiting on. Rows now queue in memory and flush as one
+    executemany upsert per batch — the durable L2 tier warms a flush
+    interval later, which costs nothing: the in-memory L1 already
+    serves the row, and a row lost to a crash is just re-embedded on
+    its next miss (so unlike the log writer, failures are dropped,
+    not re-queued).
+
+    Features:
+    - Non-blocking enqueue from the evaluate path
+    - Flush on interval or threshold
+    - ON CONFLICT DO NOTHING (idempotent under concurrent writers)
+    - Thread-safe
+    """
+
+    FLUSH_INTERVAL_SECONDS = float(
+        os.getenv("EMBEDDING_WB_FLUSH_INTERVAL_SECONDS", "2")
+    )
+    FLUSH_THRESHOLD = int(os.getenv("EMBEDDING_WB_FLUSH_THRESHOLD", "32"))
+
+    def __init__(self):
+        self.pending: List[Dict] = []
+        self.last_flush = time.time()
+        self.lock = Lock()
+
+    # -----------------------------------------------------
+    # Queue a Row
+    # -----------------------------------------------------
+    def enqueue(self, row: Dict) -> None:
+        """
+        Buffer one embedding_cache row (tenant_id, content_hash,
+        original_text, embedding, model_used).
+        """
+
+        with self.lock:
+            self.pending.append(row)
+
+            should_flush = (
+                len(self.pending) >= self.FLUSH_THRESHOLD
+                or (time.time() - self.last_flush) >= self.FLUSH_INTERVAL_SECONDS
+            )
+
+        if should_flush:
+            self.flush()
+
+    # -----------------------------------------------------
+    # Flush to Postgres
+    # -----------------------------------------------------
+    def flush(self) -> int:
+        """
+        Upsert all buffered rows in one executemany statement.
+        Returns number of rows flushed.
+        """
+
+        with self.lock:
+            if not self.pending:
+                self.last_flush = time.time()
+                return 0
+
+            batch = self.pending
+            self.pending = []
+            self.last_flush = time.time()
+
+        # Imported here to avoid a circular import at module load
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+        from app.core.database import SessionLocal
+        from app.models.embedding_cache import EmbeddingCache
+
+        db = SessionLocal()
+        try:
+            db.execute(
+                pg_insert(EmbeddingCache).on_conflict_do_nothing(
+                    index_elements=["content_hash"]
+                ),
+                batch,
+            )
+            db.commit()
+            return len(batch)
+
+        except Exception:
+            db.rollback()
+            # Dropped on purpose — the L1 cache still serves these
+            # and any lost row is re-embedded on its next miss
+            return 0
+
+        finally:
+            db.close()
+
+
+# ---------------------------------------------------------
+# Global Singleton Instance
+# ---------------------------------------------------------
+embedding_writer = EmbeddingWriteBehind()
@@ -0,0 +1,32 @@
+"""
+Single point where .env is parsed.
+
+Five modules used to call load_dotenv() at import, each walking the
+filesystem and re-parsing the file. Importing this module (directly or
+transitively) guarantees the environment is loaded exactly once;
+shared settings live here so callers import constants instead of
+repeating os.getenv.
+"""
+
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# =====================================================
+# Stripe
+# =====================================================
+
+STRIPE_SECRET_KEY = os.getenv("STRIPE_SECRET_KEY")
+STRIPE_WEBHOOK_SECRET = os.getenv("STRIPE_WEBHOOK_SECRET")
+
+FRONTEND_SUCCESS_URL = os.getenv(
+    "STRIPE_SUCCESS_URL",
+    "http://localhost:3000/success"
+)
+
+FRONTEND_CANCEL_URL = os.getenv(
+    "STRIPE_CANCEL_URL",
+    "http://localhost:3000/cancel"
+)
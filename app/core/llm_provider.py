@@ -1,5 +1,6 @@
 import os
 import math
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
 # Optional imports
@@ -26,6 +27,7 @@ class BaseEmbeddingProvider:
 class GeminiEmbeddingProvider(BaseEmbeddingProvider):
 
     DEFAULT_MODEL = "models/embedding-001"
+    MAX_CONCURRENCY = int(os.getenv("GEMINI_EMBED_CONCURRENCY", "16"))
 
     def __init__(self):
         self.api_key = os.getenv("GEMINI_API_KEY")
@@ -39,18 +41,33 @@ class GeminiEmbeddingProvider(BaseEmbeddingProvider):
 
         genai.configure(api_key=self.api_key)
 
-    def embed(self, texts: List[str]) -> List[List[float]]:
-        embeddings = []
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.MAX_CONCURRENCY,
+            thread_name_prefix="gemini-embed"
+        )
 
-        for text in texts:
-            response = genai.embed_content(
-                model=self.model,
-                content=text,
-                task_type="retrieval_document"
-            )
-            embeddings.append(response["embedding"])
+    def _embed_one(self, text: str) -> List[float]:
+        response = genai.embed_content(
+            model=self.model,
+            content=text,
+            task_type="retrieval_document"
+        )
+        return response["embedding"]
 
-        return embeddings
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        # Gemini's API takes one document per call, so a batch of K was
+        # K serial round-trips. Fan out over a thread pool so the batch
+        # costs ~max(RTT), and embed each distinct text once — RAG
+        # batches routinely repeat chunks.
+        unique_texts = list(dict.fromkeys(texts))
+
+        if len(unique_texts) == 1:
+            vectors = {unique_texts[0]: self._embed_one(unique_texts[0])}
+        else:
+            results = self._pool.map(self._embed_one, unique_texts)
+            vectors = dict(zip(unique_texts, results))
+
+        return [vectors[text] for text in texts]
 
 
 # ==========================================================
@@ -0,0 +1,202 @@
+import logging
+import os
+import threading
+import time
+from threading import Lock
+from typing import Dict, List
+
+logger = logging.getLogger("ATLAS-LOGWRITER")
+
+
+class BatchedLogWriter:
+    """
+    In-process buffer for evaluation_logs rows with batched flush.
+
+    One INSERT + commit per request means one WAL fsync per request —
+    at volume the audit trail becomes the throughput ceiling. Rows
+    queue in memory instead and flush as a single executemany INSERT
+    (one round trip, one fsync for the whole batch) every couple of
+    seconds or once enough rows pile up.
+
+    Error handling is classified so one bad row can't wedge the
+    writer forever:
+    - OperationalError (DB down/unreachable): transient — the batch
+      re-queues, capped at MAX_PENDING so an extended outage can't
+      grow memory without bound (oldest rows are dropped first).
+    - IntegrityError (e.g. a uq_request_hash_tenant duplicate from a
+      client retry): a poison row — the batch is retried row by row
+      and only the offending rows are dropped.
+    - Anything else: the batch is dropped and logged; audit rows are
+      not worth a livelock.
+
+    A daemon timer flushes on the interval even when no new enqueue
+    arrives, so buffered rows never sit indefinitely under idle
+    traffic. The app lifespan drains whatever remains on shutdown.
+    """
+
+    FLUSH_INTERVAL_SECONDS = float(os.getenv("LOG_FLUSH_INTERVAL_SECONDS", "2"))
+    FLUSH_THRESHOLD = int(os.getenv("LOG_FLUSH_THRESHOLD", "100"))
+    MAX_PENDING = int(os.getenv("LOG_PENDING_MAX", "10000"))
+
+    def __init__(self):
+        self.pending: List[Dict] = []
+        self.last_flush = time.time()
+        self.lock = Lock()
+        self._flusher_started = False
+
+    # -----------------------------------------------------
+    # Queue a Row
+    # -----------------------------------------------------
+    def enqueue(self, payload: Dict) -> None:
+        """
+        Buffer one evaluation_logs row. No DB work happens here
+        unless this call tips the batch over its flush trigger.
+        """
+
+        with self.lock:
+            self.pending.append(payload)
+            self._cap_pending_locked()
+
+            should_flush = (
+                len(self.pending) >= self.FLUSH_THRESHOLD
+                or (time.time() - self.last_flush) >= self.FLUSH_INTERVAL_SECONDS
+            )
+
+        self._ensure_flusher()
+
+        if should_flush:
+            self.flush()
+
+    def _cap_pending_locked(self) -> None:
+        """
+        Bounds the buffer; caller must hold the lock. Oldest rows go
+        first — the newest are the ones a responder will look for.
+        """
+        overflow = len(self.pending) - self.MAX_PENDING
+        if overflow > 0:
+            del self.pending[:overflow]
+            logger.warning(
+                "Log buffer full — dropped %d oldest audit rows", overflow
+            )
+
+    # -----------------------------------------------------
+    # Background Interval Flush
+    # -----------------------------------------------------
+    def _ensure_flusher(self) -> None:
+        """
+        Starts the daemon flush timer once, on first use — without
+        it, rows buffered right before traffic goes idle would sit
+        until the next request.
+        """
+        if self._flusher_started:
+            return
+
+        with self.lock:
+            if self._flusher_started:
+                return
+            self._flusher_started = True
+
+        thread = threading.Thread(
+            target=self._flush_loop, name="log-writer-flush", daemon=True
+        )
+        thread.start()
+
+    def _flush_loop(self) -> None:
+        while True:
+            time.sleep(self.FLUSH_INTERVAL_SECONDS)
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Scheduled log flush failed.")
+
+    # -----------------------------------------------------
+    # Flush to Postgres
+    # -----------------------------------------------------
+    def flush(self) -> int:
+        """
+        Insert all buffered rows in one executemany statement.
+        Returns number of rows flushed.
+        """
+
+        with self.lock:
+            if not self.pending:
+                self.last_flush = time.time()
+                return 0
+
+            batch = self.pending
+            self.pending = []
+            self.last_flush = time.time()
+
+        # Imported here to avoid a circular import at module load
+        from sqlalchemy import insert
+        from sqlalchemy.exc import IntegrityError, OperationalError
+
+        from app.core.database import SessionLocal
+        from app.models.evaluation_log import EvaluationLog
+
+        stmt = insert(EvaluationLog)
+
+        db = SessionLocal()
+        try:
+            # Passing the row list as executemany parameters keeps
+            # the statement text constant, so psycopg batches the
+            # whole set in one round trip
+            db.execute(stmt, batch)
+            db.commit()
+            return len(batch)
+
+        except OperationalError:
+            db.rollback()
+
+            # Transient (connection lost, DB restarting): re-queue
+            # so audit rows survive, within the buffer cap
+            with self.lock:
+                self.pending = batch + self.pending
+                self._cap_pending_locked()
+
+            logger.warning(
+                "Log flush hit a transient DB error — re-queued %d rows",
+                len(batch),
+            )
+            return 0
+
+        except IntegrityError:
+            db.rollback()
+
+            # A poison row (duplicate request hash from a client
+            # retry, usually). Insert the rest one by one and drop
+            # only the offenders.
+            flushed = 0
+            for row in batch:
+                try:
+                    db.execute(stmt, [row])
+                    db.commit()
+                    flushed += 1
+                except IntegrityError:
+                    db.rollback()
+                except Exception:
+                    db.rollback()
+                    logger.exception("Dropped one audit row on retry.")
+
+            dropped = len(batch) - flushed
+            if dropped:
+                logger.warning(
+                    "Log flush dropped %d conflicting audit rows", dropped
+                )
+            return flushed
+
+        except Exception:
+            db.rollback()
+            logger.exception(
+                "Log flush failed — dropped %d audit rows", len(batch)
+            )
+            return 0
+
+        finally:
+            db.close()
+
+
+# ---------------------------------------------------------
+# Global Singleton Instance
+# ---------------------------------------------------------
+log_writer = BatchedLogWriter()
@@ -1,7 +1,18 @@
 import time
-from collections import defaultdict, deque
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
 from threading import Lock
-from typing import Dict, Deque, Optional
+from typing import Dict, Optional
+
+
+def _now_ms() -> int:
+    # Monotonic millis — immune to wall-clock jumps (NTP, DST)
+    return time.monotonic_ns() // 1_000_000
+
+
+def _new_window() -> array:
+    return array("q")
 
 
 class InMemoryRateLimiter:
@@ -11,15 +22,28 @@ class InMemoryRateLimiter:
     Features:
     - Per-key sliding window
     - Configurable window size
-    - O(1) cleanup using deque
     - Memory-safe pruning
     - Usage metrics support
+    - Lock striping (64 shards) so tenants don't contend on one lock
+    - Windows stored as int64 millisecond arrays (8B/entry vs 28B for
+      Python floats); expiry found by binary search, dropped in one slice
     """
 
+    SHARD_COUNT = 64  # power of two → cheap masking instead of modulo
+
     def __init__(self, window_seconds: int = 60):
         self.window_seconds = window_seconds
-        self.requests: Dict[str, Deque[float]] = defaultdict(deque)
-        self.lock = Lock()
+        self.window_ms = window_seconds * 1000
+        self._shards = [
+            {"lock": Lock(), "requests": defaultdict(_new_window)}
+            for _ in range(self.SHARD_COUNT)
+        ]
+
+    # -----------------------------------------------------
+    # Shard Selection
+    # -----------------------------------------------------
+    def _shard(self, key: str) -> dict:
+        return self._shards[hash(key) & (self.SHARD_COUNT - 1)]
 
     # -----------------------------------------------------
     # Core Check
@@ -29,20 +53,22 @@ class InMemoryRateLimiter:
         Returns True if request allowed, False if rate limit exceeded.
         """
 
-        now = time.time()
-        window_start = now - self.window_seconds
+        now = _now_ms()
+        cutoff = now - self.window_ms
+        shard = self._shard(key)
 
-        with self.lock:
-            queue = self.requests[key]
+        with shard["lock"]:
+            window = shard["requests"][key]
 
-            # Remove expired timestamps (O(k))
-            while queue and queue[0] < window_start:
-                queue.popleft()
+            # First live index via binary search, expired run sliced off
+            idx = bisect_left(window, cutoff)
+            if idx:
+                del window[:idx]
 
-            if len(queue) >= limit:
+            if len(window) >= limit:
                 return False
 
-            queue.append(now)
+            window.append(now)
             return True
 
     # -----------------------------------------------------
@@ -53,16 +79,18 @@ class InMemoryRateLimiter:
         Returns remaining requests in current window.
         """
 
-        now = time.time()
-        window_start = now - self.window_seconds
+        now = _now_ms()
+        cutoff = now - self.window_ms
+        shard = self._shard(key)
 
-        with self.lock:
-            queue = self.requests[key]
+        with shard["lock"]:
+            window = shard["requests"][key]
 
-            while queue and queue[0] < window_start:
-                queue.popleft()
+            idx = bisect_left(window, cutoff)
+            if idx:
+                del window[:idx]
 
-            return max(limit - len(queue), 0)
+            return max(limit - len(window), 0)
 
     # -----------------------------------------------------
     # Reset a Key
@@ -73,9 +101,11 @@ class InMemoryRateLimiter:
         Useful when rotating keys.
         """
 
-        with self.lock:
-            if key in self.requests:
-                del self.requests[key]
+        shard = self._shard(key)
+
+        with shard["lock"]:
+            if key in shard["requests"]:
+                del shard["requests"][key]
 
     # -----------------------------------------------------
     # Cleanup Idle Keys
@@ -84,21 +114,27 @@ class InMemoryRateLimiter:
         """
         Removes keys that have been idle for a long time.
         Prevents memory bloat.
+
+        Each shard is swept under its own lock, so cleanup never
+        stalls the other shards' hot paths.
         """
 
-        now = time.time()
+        now = _now_ms()
+        idle_ms = idle_seconds * 1000
 
-        with self.lock:
-            keys_to_delete = []
+        for shard in self._shards:
+            with shard["lock"]:
+                requests = shard["requests"]
+                keys_to_delete = []
 
-            for key, queue in self.requests.items():
-                if not queue:
-                    keys_to_delete.append(key)
-                elif now - queue[-1] > idle_seconds:
-                    keys_to_delete.append(key)
+                for key, window in requests.items():
+                    if not window:
+                        keys_to_delete.append(key)
+                    elif now - window[-1] > idle_ms:
+                        keys_to_delete.append(key)
 
-            for key in keys_to_delete:
-                del self.requests[key]
+                for key in keys_to_delete:
+                    del requests[key]
 
     # -----------------------------------------------------
     # Debug / Metrics
@@ -108,14 +144,19 @@ class InMemoryRateLimiter:
         Returns internal stats for monitoring.
         """
 
-        with self.lock:
-            return {
-                "total_tracked_keys": len(self.requests),
-                "window_seconds": self.window_seconds
-            }
+        total = 0
+        for shard in self._shards:
+            with shard["lock"]:
+                total += len(shard["requests"])
+
+        return {
+            "total_tracked_keys": total,
+            "window_seconds": self.window_seconds,
+            "shards": self.SHARD_COUNT
+        }
 
 
 # ---------------------------------------------------------
 # Global Singleton Instance
 # ---------------------------------------------------------
-rate_limiter = InMemoryRateLimiter(window_seconds=60)
\ No newline at end of file
+rate_limiter = InMemoryRateLimiter(window_seconds=60)
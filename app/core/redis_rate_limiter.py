@@ -0,0 +1,131 @@
+import os
+import time
+import logging
+from typing import Dict
+
+from app.core.rate_limiter import InMemoryRateLimiter, rate_limiter as _memory_limiter
+
+logger = logging.getLogger("ATLAS-RATELIMIT")
+
+REDIS_URL = os.getenv("REDIS_URL")
+
+
+# ---------------------------------------------------------
+# Sliding window check as one atomic round trip.
+# ZREMRANGEBYSCORE drops expired entries, ZCARD counts the
+# window, ZADD records the hit only when under the limit.
+# ---------------------------------------------------------
+_CHECK_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, ARGV[1])
+local c = redis.call('ZCARD', KEYS[1])
+if c >= tonumber(ARGV[3]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], ARGV[2], ARGV[2])
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return 1
+"""
+
+_COUNT_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, ARGV[1])
+return redis.call('ZCARD', KEYS[1])
+"""
+
+
+class RedisRateLimiter:
+    """
+    Redis-backed sliding window rate limiter.
+
+    Unlike InMemoryRateLimiter, state is shared across workers, so a
+    tenant's limit holds under --workers=N and survives deploys.
+    Memory is bounded by the key TTL instead of a Python sweeper.
+    """
+
+    def __init__(self, redis_url: str, window_seconds: int = 60):
+        import redis  # optional dependency; only needed when REDIS_URL is set
+
+        self.window_seconds = window_seconds
+        self._redis = redis.Redis.from_url(redis_url, decode_responses=True)
+        self._check = self._redis.register_script(_CHECK_SCRIPT)
+        self._count = self._redis.register_script(_COUNT_SCRIPT)
+
+    # -----------------------------------------------------
+    # Core Check
+    # -----------------------------------------------------
+    def is_allowed(self, key: str, limit: int) -> bool:
+        """
+        Returns True if request allowed, False if rate limit exceeded.
+        """
+
+        now = time.time()
+
+        try:
+            allowed = self._check(
+                keys=[f"rl:{key}"],
+                args=[now - self.window_seconds, now, limit, self.window_seconds],
+            )
+            return allowed == 1
+
+        except Exception:
+            # Redis down → fail open rather than reject every request
+            logger.exception("Redis rate limit check failed; allowing request")
+            return True
+
+    # -----------------------------------------------------
+    # Remaining Requests
+    # -----------------------------------------------------
+    def remaining(self, key: str, limit: int) -> int:
+        """
+        Returns remaining requests in current window.
+        """
+
+        now = time.time()
+
+        try:
+            used = self._count(
+                keys=[f"rl:{key}"],
+                args=[now - self.window_seconds],
+            )
+            return max(limit - int(used), 0)
+
+        except Exception:
+            logger.exception("Redis rate limit count failed")
+            return limit
+
+    # -----------------------------------------------------
+    # Reset a Key
+    # -----------------------------------------------------
+    def reset(self, key: str):
+        """
+        Clears rate limit data for a specific key.
+        Useful when rotating keys.
+        """
+
+        try:
+            self._redis.delete(f"rl:{key}")
+        except Exception:
+            logger.exception("Redis rate limit reset failed")
+
+    # -----------------------------------------------------
+    # Debug / Metrics
+    # -----------------------------------------------------
+    def stats(self) -> Dict:
+        """
+        Returns internal stats for monitoring.
+        """
+
+        return {
+            "backend": "redis",
+            "window_seconds": self.window_seconds
+        }
+
+
+# ---------------------------------------------------------
+# Backend Selection
+# ---------------------------------------------------------
+# Redis when configured (correct across workers), otherwise the
+# per-process limiter — same interface either way.
+if REDIS_URL:
+    rate_limiter = RedisRateLimiter(REDIS_URL, window_seconds=60)
+else:
+    rate_limiter = _memory_limiter
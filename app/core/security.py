@@ -14,8 +14,10 @@ Handles:
 from typing import Optional
 
 from fastapi import Header, HTTPException, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import Session, joinedload
 
+from app.core.auth_cache import tenant_auth_cache
 from app.core.database import get_db
 from app.models.api_key import TenantAPIKey
 from app.models.tenant import Tenant
@@ -34,6 +36,25 @@ from starlette.status import (
 API_KEY_HEADER = "x-api-key"
 
 
+# ============================================================
+# PREPARED STATEMENTS
+# ============================================================
+# Built once at import; every auth call reuses the same expression
+# graph so the compiled SQL comes straight from the statement cache.
+
+_stmt_key_by_prefix = select(TenantAPIKey).where(
+    TenantAPIKey.key_prefix == bindparam("prefix"),
+    TenantAPIKey.is_active.is_(True),
+    TenantAPIKey.is_revoked.is_(False),
+)
+
+_stmt_tenant_by_id = (
+    select(Tenant)
+    .options(joinedload(Tenant.pricing_plan))
+    .where(Tenant.tenant_id == bindparam("tid"))
+)
+
+
 # ============================================================
 # CORE AUTH LOGIC
 # ============================================================
@@ -62,15 +83,9 @@ def authenticate_api_key(
     # Extract prefix for fast lookup
     key_prefix = raw_api_key[:20]
 
-    api_key_record: Optional[TenantAPIKey] = (
-        db.query(TenantAPIKey)
-        .filter(
-            TenantAPIKey.key_prefix == key_prefix,
-            TenantAPIKey.is_active.is_(True),
-            TenantAPIKey.is_revoked.is_(False),
-        )
-        .first()
-    )
+    api_key_record: Optional[TenantAPIKey] = db.execute(
+        _stmt_key_by_prefix, {"prefix": key_prefix}
+    ).scalars().first()
 
     if not api_key_record:
         raise HTTPException(
@@ -85,12 +100,12 @@ def authenticate_api_key(
             detail="Invalid API key"
         )
 
-    # Fetch tenant
-    tenant: Optional[Tenant] = (
-        db.query(Tenant)
-        .filter(Tenant.tenant_id == api_key_record.tenant_id)
-        .first()
-    )
+    # Fetch tenant with its plan in one SELECT — the evaluate hot path
+    # reads tenant.pricing_plan.hard_limit/request_limit immediately,
+    # so a lazy load here would mean an extra round trip per request.
+    tenant: Optional[Tenant] = db.execute(
+        _stmt_tenant_by_id, {"tid": api_key_record.tenant_id}
+    ).scalars().first()
 
     if not tenant:
         raise HTTPException(
@@ -131,4 +146,17 @@ def get_current_tenant(
         ...
     """
 
-    return authenticate_api_key(x_api_key, db)
\ No newline at end of file
+    # Short-TTL cache: repeat keys skip the hash + two SELECTs
+    if x_api_key:
+        cache_key = tenant_auth_cache.key_for(x_api_key)
+        cached = tenant_auth_cache.get(cache_key)
+
+        if cached is not None:
+            return cached
+
+    tenant = authenticate_api_key(x_api_key, db)
+
+    if x_api_key:
+        tenant_auth_cache.set(cache_key, tenant, tenant_id=tenant.tenant_id)
+
+    return tenant
\ No newline at end of file
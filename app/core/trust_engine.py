@@ -51,6 +51,19 @@ class TrustEngine:
     def __init__(self, weights: Optional[TrustWeights] = None):
         self.weights = weights if weights else TrustWeights()
 
+        # Risk level → penalty table, built once so compute() does a
+        # single dict lookup instead of walking an if/elif ladder
+        self._risk_map = {
+            "CRITICAL": self.weights.critical_risk_penalty,
+            "HIGH": self.weights.high_risk_penalty,
+            "MEDIUM": self.weights.medium_risk_penalty,
+        }
+
+        # compute is specialized per weights instance: the closure
+        # captures the weight values, so the hot path reads locals
+        # instead of chasing self.weights attributes six times per call
+        self.compute = self._specialize(self.weights, self._risk_map)
+
     # -----------------------------------------------------
     # Utility: Clamp values to safe range
     # -----------------------------------------------------
@@ -59,113 +72,74 @@ class TrustEngine:
         return max(0.0, min(1.0, value))
 
     # -----------------------------------------------------
-    # Core Computation
+    # Core Computation (specialized per weights)
     # -----------------------------------------------------
 
-    def compute(
-        self,
-        hallucination: float,
-        grounding: float,
-        risk: str,
-        number_conflict: bool = False,
-        confidence_mismatch: bool = False,
-        semantic_risk: bool = False,
-    ) -> Dict:
-
-        # Safety clamp
-        hallucination = self._clamp_probability(hallucination)
-        grounding = self._clamp_probability(grounding)
-
-        breakdown: Dict[str, float] = {}
-
-        # =====================================================
-        # 1️⃣ Hallucination Penalty
-        # =====================================================
-
-        hallucination_penalty = hallucination * self.weights.hallucination_weight
-        breakdown["hallucination_penalty"] = round(hallucination_penalty, 2)
-
-        # =====================================================
-        # 2️⃣ Grounding Penalty
-        # =====================================================
-
-        grounding_penalty = (1 - grounding) * self.weights.grounding_weight
-        breakdown["grounding_penalty"] = round(grounding_penalty, 2)
-
-        # =====================================================
-        # 3️⃣ Business Risk Penalty
-        # =====================================================
-
-        risk_penalty = 0.0
-
-        risk_normalized = str(risk).upper()
-
-        if risk_normalized == "CRITICAL":
-            risk_penalty = self.weights.critical_risk_penalty
-        elif risk_normalized == "HIGH":
-            risk_penalty = self.weights.high_risk_penalty
-        elif risk_normalized == "MEDIUM":
-            risk_penalty = self.weights.medium_risk_penalty
-
-        breakdown["risk_penalty"] = risk_penalty
-
-        # =====================================================
-        # 4️⃣ Numeric Conflict Penalty
-        # =====================================================
-
-        number_penalty = (
-            self.weights.number_conflict_penalty
-            if number_conflict else 0.0
-        )
-
-        breakdown["number_conflict_penalty"] = number_penalty
-
-        # =====================================================
-        # 5️⃣ Confidence Mismatch Penalty
-        # =====================================================
-
-        confidence_penalty = (
-            self.weights.confidence_mismatch_penalty
-            if confidence_mismatch else 0.0
-        )
-
-        breakdown["confidence_mismatch_penalty"] = confidence_penalty
-
-        # =====================================================
-        # 6️⃣ Semantic Risk Penalty
-        # =====================================================
-
-        semantic_penalty = (
-            self.weights.semantic_risk_penalty
-            if semantic_risk else 0.0
-        )
-
-        breakdown["semantic_risk_penalty"] = semantic_penalty
-
-        # =====================================================
-        # 7️⃣ Total Penalty Calculation
-        # =====================================================
-
-        total_penalty = (
-            hallucination_penalty
-            + grounding_penalty
-            + risk_penalty
-            + number_penalty
-            + confidence_penalty
-            + semantic_penalty
-        )
-
-        breakdown["total_penalty"] = round(total_penalty, 2)
-
-        # =====================================================
-        # 8️⃣ Final Trust Score
-        # =====================================================
-
-        final_score = max(int(self.weights.base_score - total_penalty), 0)
-
-        breakdown["final_score"] = final_score
-
-        return {
-            "trust_score": final_score,
-            "breakdown": breakdown
-        }
\ No newline at end of file
+    @staticmethod
+    def _specialize(weights: TrustWeights, risk_map: Dict[str, float]):
+
+        # Extracted once; inside compute these are cell loads, not
+        # dataclass attribute lookups
+        base_score = weights.base_score
+        hallucination_weight = weights.hallucination_weight
+        grounding_weight = weights.grounding_weight
+        number_conflict_penalty = weights.number_conflict_penalty
+        confidence_mismatch_penalty = weights.confidence_mismatch_penalty
+        semantic_risk_penalty = weights.semantic_risk_penalty
+        risk_lookup = risk_map.get
+
+        def compute(
+            hallucination: float,
+            grounding: float,
+            risk: str,
+            number_conflict: bool = False,
+            confidence_mismatch: bool = False,
+            semantic_risk: bool = False,
+        ) -> Dict:
+
+            # Safety clamp
+            hallucination = max(0.0, min(1.0, hallucination))
+            grounding = max(0.0, min(1.0, grounding))
+
+            # 1️⃣ Hallucination / 2️⃣ Grounding penalties
+            hallucination_penalty = hallucination * hallucination_weight
+            grounding_penalty = (1 - grounding) * grounding_weight
+
+            # 3️⃣ Business risk penalty (table lookup)
+            risk_penalty = risk_lookup(str(risk).upper(), 0.0)
+
+            # 4️⃣-6️⃣ Boolean penalties — bool * weight is branchless
+            number_penalty = number_conflict * number_conflict_penalty
+            confidence_penalty = (
+                confidence_mismatch * confidence_mismatch_penalty
+            )
+            semantic_penalty = semantic_risk * semantic_risk_penalty
+
+            # 7️⃣ Total penalty
+            total_penalty = (
+                hallucination_penalty
+                + grounding_penalty
+                + risk_penalty
+                + number_penalty
+                + confidence_penalty
+                + semantic_penalty
+            )
+
+            # 8️⃣ Final trust score
+            final_score = max(int(base_score - total_penalty), 0)
+
+            return {
+                "trust_score": final_score,
+                "breakdown": {
+                    "hallucination_penalty": round(hallucination_penalty, 2),
+                    "grounding_penalty": round(grounding_penalty, 2),
+                    "risk_penalty": risk_penalty,
+                    "number_conflict_penalty": number_penalty,
+                    "confidence_mismatch_penalty": confidence_penalty,
+                    "semantic_risk_penalty": semantic_penalty,
+                    "total_penalty": round(total_penalty, 2),
+                    "final_score": final_score,
+                },
+            }
+
+        return compute
\ No newline at end of file
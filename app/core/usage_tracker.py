@@ -0,0 +1,122 @@
+import os
+import time
+from datetime import datetime
+from threading import Lock
+from typing import Dict
+
+
+class BatchedUsageTracker:
+    """
+    In-process usage counter with batched DB flush.
+
+    Instead of issuing a row-level UPDATE + commit fsync on the tenant
+    row for every request, increments accumulate in memory and are
+    flushed as a single UPDATE per tenant every few seconds (or once
+    enough increments pile up). This removes the hot-row write
+    contention from the evaluate path.
+
+    Features:
+    - Per-tenant pending counters
+    - Flush on interval or threshold
+    - Atomic SQL increments (no read-modify-write races)
+    - Thread-safe
+    """
+
+    FLUSH_INTERVAL_SECONDS = float(os.getenv("USAGE_FLUSH_INTERVAL_SECONDS", "10"))
+    FLUSH_THRESHOLD = int(os.getenv("USAGE_FLUSH_THRESHOLD", "50"))
+
+    def __init__(self):
+        self.pending: Dict[str, int] = {}
+        self.last_flush = time.time()
+        self.lock = Lock()
+
+    # -----------------------------------------------------
+    # Record a Request
+    # -----------------------------------------------------
+    def increment(self, tenant_id: str) -> int:
+        """
+        Record one request for a tenant.
+        Returns the pending (not-yet-flushed) count so callers can
+        include it in limit checks.
+        """
+
+        with self.lock:
+            self.pending[tenant_id] = self.pending.get(tenant_id, 0) + 1
+            pending = self.pending[tenant_id]
+
+            should_flush = (
+                pending >= self.FLUSH_THRESHOLD
+                or (time.time() - self.last_flush) >= self.FLUSH_INTERVAL_SECONDS
+            )
+
+        if should_flush:
+            self.flush()
+
+        return pending
+
+    # -----------------------------------------------------
+    # Pending Count (For Limit Checks)
+    # -----------------------------------------------------
+    def pending_for(self, tenant_id: str) -> int:
+        with self.lock:
+            return self.pending.get(tenant_id, 0)
+
+    # -----------------------------------------------------
+    # Flush to Postgres
+    # -----------------------------------------------------
+    def flush(self) -> int:
+        """
+        Flush all pending counters in one UPDATE per tenant.
+        Returns number of tenants flushed.
+        """
+
+        with self.lock:
+            if not self.pending:
+                self.last_flush = time.time()
+                return 0
+
+            batch = self.pending
+            self.pending = {}
+            self.last_flush = time.time()
+
+        # Imported here to avoid a circular import at module load
+        from app.core.database import SessionLocal
+        from app.models.tenant import Tenant
+
+        db = SessionLocal()
+        try:
+            now = datetime.utcnow()
+
+            for tenant_id, count in batch.items():
+                db.query(Tenant).filter(
+                    Tenant.tenant_id == tenant_id
+                ).update(
+                    {
+                        Tenant.current_month_usage: Tenant.current_month_usage + count,
+                        Tenant.lifetime_usage: Tenant.lifetime_usage + count,
+                        Tenant.last_request_at: now,
+                    },
+                    synchronize_session=False,
+                )
+
+            db.commit()
+            return len(batch)
+
+        except Exception:
+            db.rollback()
+
+            # Re-queue so counts are not lost on a transient DB error
+            with self.lock:
+                for tenant_id, count in batch.items():
+                    self.pending[tenant_id] = self.pending.get(tenant_id, 0) + count
+
+            return 0
+
+        finally:
+            db.close()
+
+
+# ---------------------------------------------------------
+# Global Singleton Instance
+# ---------------------------------------------------------
+usage_tracker = BatchedUsageTracker()
@@ -1,3 +1,5 @@
+import re
+import sys
 from typing import Dict, List
 
 
@@ -34,17 +36,38 @@ class BusinessRiskEngine:
         "policy": 1,
     }
 
+    # One compiled alternation scans the query in a single C-level
+    # pass instead of K separate substring searches. Longer keywords
+    # first so no entry shadows another's prefix.
+    _KEYWORD_RE = re.compile(
+        "|".join(
+            map(re.escape, sorted(RISK_REGISTRY, key=len, reverse=True))
+        )
+    )
+
+    # Interned singletons in registry order. Regex matches are fresh
+    # string slices; mapping them through this table means responses
+    # always carry the same shared keyword objects instead of
+    # allocating new ones per request.
+    _KEYWORDS = tuple(sys.intern(k) for k in RISK_REGISTRY)
+    _INTERNED = {k: k for k in _KEYWORDS}
+
     def assess(self, query: str) -> Dict:
         query_lower = query.lower()
 
-        triggered_keywords: List[str] = []
-        risk_score = 0
+        # Substring semantics match the old per-keyword `in` checks;
+        # each keyword scores at most once
+        found = {
+            self._INTERNED[m]
+            for m in self._KEYWORD_RE.findall(query_lower)
+        }
 
-        # Calculate weighted risk score
-        for keyword, weight in self.RISK_REGISTRY.items():
-            if keyword in query_lower:
-                risk_score += weight
-                triggered_keywords.append(keyword)
+        triggered_keywords: List[str] = [
+            k for k in self._KEYWORDS if k in found
+        ]
+        risk_score = sum(
+            self.RISK_REGISTRY[k] for k in triggered_keywords
+        )
 
         # Classify risk level
         if risk_score >= 5:
@@ -1,4 +1,12 @@
-from typing import Dict, List
+import re
+from typing import Dict, List, Optional, Pattern
+
+from app.engines.evaluation_context import EvaluationContext
+
+
+def _alternation(phrases: List[str]) -> str:
+    # Longest first so multi-word phrases aren't shadowed by prefixes
+    return "|".join(map(re.escape, sorted(phrases, key=len, reverse=True)))
 
 
 class ConfidenceMismatchEngine:
@@ -47,10 +55,31 @@ class ConfidenceMismatchEngine:
         "estimated"
     ]
 
-    def _count_matches(self, phrases: List[str], text: str) -> int:
-        return sum(1 for phrase in phrases if phrase in text)
+    # All three categories fused into one alternation with a named
+    # group per category: the response is walked once instead of
+    # three times, and match.lastgroup says which bucket was hit
+    _PHRASE_RE: Pattern = re.compile(
+        "(?P<high>{})|(?P<medium>{})|(?P<uncertainty>{})".format(
+            _alternation(HIGH_CONFIDENCE_PHRASES),
+            _alternation(MEDIUM_CONFIDENCE_PHRASES),
+            _alternation(UNCERTAINTY_PHRASES),
+        )
+    )
+
+    def _count_phrases(self, text: str) -> Dict[str, int]:
+        # Distinct phrases per category, mirroring the old presence
+        # checks — a phrase repeated ten times still scores once
+        seen = {"high": set(), "medium": set(), "uncertainty": set()}
+        for match in self._PHRASE_RE.finditer(text):
+            seen[match.lastgroup].add(match.group())
+        return {category: len(hits) for category, hits in seen.items()}
 
-    def evaluate(self, response: str, grounding_score: float) -> Dict:
+    def evaluate(
+        self,
+        response: str,
+        grounding_score: float,
+        ctx: Optional[EvaluationContext] = None
+    ) -> Dict:
         """
         Returns:
         {
@@ -61,11 +90,12 @@ class ConfidenceMismatchEngine:
         }
         """
 
-        text = response.lower()
+        text = ctx.response_lower if ctx is not None else response.lower()
 
-        high_count = self._count_matches(self.HIGH_CONFIDENCE_PHRASES, text)
-        medium_count = self._count_matches(self.MEDIUM_CONFIDENCE_PHRASES, text)
-        uncertainty_count = self._count_matches(self.UNCERTAINTY_PHRASES, text)
+        counts = self._count_phrases(text)
+        high_count = counts["high"]
+        medium_count = counts["medium"]
+        uncertainty_count = counts["uncertainty"]
 
         # Confidence intensity calculation
         confidence_score = min(
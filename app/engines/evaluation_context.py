@@ -0,0 +1,76 @@
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import List, Tuple
+
+_NUMBER_RE = re.compile(r"\d+")
+_TOKEN_RE = re.compile(r"\b\w+\b")
+
+# Shared by grounding and hallucination — one frozenset hashed at
+# import instead of a per-class set rebuilt in each module
+STOPWORDS = frozenset({
+    "the", "is", "are", "a", "an", "to", "of", "and",
+    "in", "for", "on", "with", "that", "this", "it",
+    "as", "at", "by", "from", "or", "be"
+})
+
+
+def tokenize(lowered_text: str) -> List[str]:
+    """Single-pass tokenize + stopword filter over lowered text."""
+    return [
+        t for t in _TOKEN_RE.findall(lowered_text)
+        if t not in STOPWORDS
+    ]
+
+
+@dataclass(frozen=True)
+class EvaluationContext:
+    """
+    Per-request precomputation shared across engines.
+
+    Every engine used to independently lowercase, join and regex the
+    same response and context strings. Computing them once here turns
+    that repeated string traffic into field reads.
+    """
+
+    context_joined: str
+    context_joined_lower: str
+    response_lower: str
+    context_numbers: Tuple[int, ...]
+    response_numbers: Tuple[int, ...]
+    context_token_count: int
+    response_token_count: int
+    context_counter: Counter
+    response_counter: Counter
+
+    @classmethod
+    def build(
+        cls,
+        context: List[str],
+        response: str
+    ) -> "EvaluationContext":
+
+        context_joined = " ".join(context)
+        context_joined_lower = context_joined.lower()
+        response_lower = response.lower()
+
+        # Tokenized once here; grounding and hallucination both read
+        # the counters instead of re-scanning the same strings
+        context_tokens = tokenize(context_joined_lower)
+        response_tokens = tokenize(response_lower)
+
+        return cls(
+            context_joined=context_joined,
+            context_joined_lower=context_joined_lower,
+            response_lower=response_lower,
+            context_numbers=tuple(
+                map(int, _NUMBER_RE.findall(context_joined))
+            ),
+            response_numbers=tuple(
+                map(int, _NUMBER_RE.findall(response))
+            ),
+            context_token_count=len(context_tokens),
+            response_token_count=len(response_tokens),
+            context_counter=Counter(context_tokens),
+            response_counter=Counter(response_tokens),
+        )
@@ -1,7 +1,8 @@
-import re
-from typing import List, Dict
+from typing import Dict, List, Optional
 from collections import Counter
 
+from app.engines.evaluation_context import EvaluationContext, tokenize
+
 
 class GroundingEngine:
     """
@@ -9,17 +10,12 @@ class GroundingEngine:
     Measures how much response is supported by retrieved context.
     """
 
-    STOPWORDS = {
-        "the", "is", "are", "a", "an", "to", "of", "and",
-        "in", "for", "on", "with", "that", "this", "it",
-        "as", "at", "by", "from", "or", "be"
-    }
-
-    def _tokenize(self, text: str) -> List[str]:
-        tokens = re.findall(r"\b\w+\b", text.lower())
-        return [t for t in tokens if t not in self.STOPWORDS]
-
-    def score(self, context: List[str], response: str) -> Dict:
+    def score(
+        self,
+        context: List[str],
+        response: str,
+        ctx: Optional[EvaluationContext] = None
+    ) -> Dict:
         """
         Returns:
         {
@@ -36,30 +32,36 @@ class GroundingEngine:
                 "context_coverage": 0.0
             }
 
-        # Combine context into single string
-        full_context = " ".join(context)
+        # Token counters come precomputed from the shared ctx — the
+        # hallucination engine reads the same ones, so both strings
+        # are tokenized once per evaluation
+        if ctx is not None:
+            response_counter = ctx.response_counter
+            context_counter = ctx.context_counter
+            response_token_count = ctx.response_token_count
+        else:
+            response_tokens = tokenize(response.lower())
+            context_tokens = tokenize(" ".join(context).lower())
+            response_counter = Counter(response_tokens)
+            context_counter = Counter(context_tokens)
+            response_token_count = len(response_tokens)
 
-        response_tokens = self._tokenize(response)
-        context_tokens = self._tokenize(full_context)
-
-        if not response_tokens or not context_tokens:
+        if not response_counter or not context_counter:
             return {
                 "grounding_score": 0.0,
                 "overlap_ratio": 0.0,
                 "context_coverage": 0.0
             }
 
-        response_counter = Counter(response_tokens)
-        context_counter = Counter(context_tokens)
-
-        # Token overlap
-        common_tokens = set(response_counter.keys()) & set(context_counter.keys())
-        overlap_count = sum(min(response_counter[t], context_counter[t]) for t in common_tokens)
+        # Counter intersection does the per-token min() in C and
+        # walks the hash buckets once — no extra sets, no Python loop
+        intersection = response_counter & context_counter
+        overlap_count = sum(intersection.values())
 
-        overlap_ratio = overlap_count / len(response_tokens)
+        overlap_ratio = overlap_count / response_token_count
 
         # Context coverage
-        coverage_ratio = len(common_tokens) / len(set(context_tokens))
+        coverage_ratio = len(intersection) / len(context_counter)
 
         # Weighted grounding score
         grounding_score = round(
@@ -1,7 +1,8 @@
-import re
-from typing import List, Dict
+from typing import Dict, List, Optional
 from collections import Counter
 
+from app.engines.evaluation_context import EvaluationContext, tokenize
+
 
 class HallucinationEngine:
     """
@@ -9,21 +10,12 @@ class HallucinationEngine:
     Measures divergence between response and retrieved context.
     """
 
-    STOPWORDS = {
-        "the", "is", "are", "a", "an", "to", "of", "and",
-        "in", "for", "on", "with", "that", "this", "it",
-        "as", "at", "by", "from", "or", "be"
-    }
-
-    def _tokenize(self, text: str) -> List[str]:
-        tokens = re.findall(r"\b\w+\b", text.lower())
-        return [t for t in tokens if t not in self.STOPWORDS]
-
     def score(
         self,
         context: List[str],
         response: str,
-        number_conflict: bool = False
+        number_conflict: bool = False,
+        ctx: Optional[EvaluationContext] = None
     ) -> Dict:
         """
         Returns:
@@ -44,12 +36,19 @@ class HallucinationEngine:
                 "context_absence_penalty": 0.7
             }
 
-        full_context = " ".join(context)
-
-        response_tokens = self._tokenize(response)
-        context_tokens = self._tokenize(full_context)
-
-        if not response_tokens:
+        # Same precomputed counters the grounding engine reads
+        if ctx is not None:
+            response_counter = ctx.response_counter
+            context_counter = ctx.context_counter
+            response_token_count = ctx.response_token_count
+        else:
+            response_tokens = tokenize(response.lower())
+            context_tokens = tokenize(" ".join(context).lower())
+            response_counter = Counter(response_tokens)
+            context_counter = Counter(context_tokens)
+            response_token_count = len(response_tokens)
+
+        if not response_counter:
             return {
                 "hallucination_score": 0.0,
                 "divergence_score": 0.0,
@@ -57,22 +56,20 @@ class HallucinationEngine:
                 "context_absence_penalty": 0.0
             }
 
-        response_counter = Counter(response_tokens)
-        context_counter = Counter(context_tokens)
+        # One C-level Counter intersection replaces the unsupported
+        # list build and the separate set() overlap below
+        intersection = response_counter & context_counter
 
-        # Tokens in response not supported by context
-        unsupported_tokens = [
-            t for t in response_counter if t not in context_counter
-        ]
+        # Distinct response tokens not supported by context
+        unsupported_count = len(response_counter) - len(intersection)
 
-        unsupported_ratio = len(unsupported_tokens) / len(response_tokens)
+        unsupported_ratio = unsupported_count / response_token_count
 
         # Divergence score (penalize unsupported claims heavily)
         divergence_score = min(unsupported_ratio * 1.2, 1.0)
 
         # Context absence penalty (if weak overlap)
-        common_tokens = set(response_tokens) & set(context_tokens)
-        overlap_ratio = len(common_tokens) / len(response_tokens)
+        overlap_ratio = len(intersection) / response_token_count
 
         context_absence_penalty = 1 - overlap_ratio
 
@@ -1,5 +1,11 @@
 import re
-from typing import List, Dict
+from typing import Dict, List, Optional
+
+from app.engines.evaluation_context import EvaluationContext
+
+# Compiled once; re.findall(pattern_string, ...) re-resolves the
+# cached pattern on every call, finditer on a compiled object doesn't
+_NUMBER_RE = re.compile(r"\d+")
 
 
 class NumberConflictEngine:
@@ -12,9 +18,14 @@ class NumberConflictEngine:
     """
 
     def _extract_numbers(self, text: str) -> List[int]:
-        return list(map(int, re.findall(r"\d+", text)))
+        return [int(m.group()) for m in _NUMBER_RE.finditer(text)]
 
-    def detect_conflict(self, context: List[str], response: str) -> Dict:
+    def detect_conflict(
+        self,
+        context: List[str],
+        response: str,
+        ctx: Optional[EvaluationContext] = None
+    ) -> Dict:
         """
         Returns:
         {
@@ -27,10 +38,13 @@ class NumberConflictEngine:
         }
         """
 
-        full_context = " ".join(context)
-
-        context_numbers = self._extract_numbers(full_context)
-        response_numbers = self._extract_numbers(response)
+        if ctx is not None:
+            context_numbers = list(ctx.context_numbers)
+            response_numbers = list(ctx.response_numbers)
+        else:
+            full_context = " ".join(context)
+            context_numbers = self._extract_numbers(full_context)
+            response_numbers = self._extract_numbers(response)
 
         result = {
             "conflict": False,
@@ -44,8 +58,8 @@ class NumberConflictEngine:
         if not context_numbers or not response_numbers:
             return result
 
-        context_set = set(context_numbers)
-        response_set = set(response_numbers)
+        context_set = frozenset(context_numbers)
+        response_set = frozenset(response_numbers)
 
         # 1️⃣ New numeric claims
         new_numbers = response_set - context_set
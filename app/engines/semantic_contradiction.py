@@ -1,15 +1,16 @@
 import os
-import math
 import time
 from typing import Dict, List, Optional
 
+import numpy as np
 import google.generativeai as genai
-from dotenv import load_dotenv
+import app.core.env  # noqa: F401
 from sqlalchemy.orm import Session
 
+from app.core.embedding_writer import embedding_writer
 from app.models.embedding_cache import EmbeddingCache as DBEmbeddingCache
+from app.services.embedding_cache import EmbeddingCache as MemoryEmbeddingCache
 
-load_dotenv()
 
 
 class SemanticContradictionEngine:
@@ -18,7 +19,7 @@ class SemanticContradictionEngine:
 
     ✔ Tenant-aware DB cache
     ✔ Lazy Gemini configuration
-    ✔ Pure Python cosine similarity
+    ✔ BLAS-backed cosine similarity
     ✔ Hard timeout protection
     ✔ Fail-safe mode (never crashes ATLAS)
     ✔ Cost optimized
@@ -27,6 +28,11 @@ class SemanticContradictionEngine:
 
     DEFAULT_MODEL = "models/embedding-001"
     DEFAULT_TIMEOUT_SECONDS = 8
+    DEFAULT_SKIP_THRESHOLD = 0.85
+
+    # Process-wide count of evaluations skipped by strong grounding
+    # (each skip is two embeds not paid for)
+    skipped_count = 0
 
     def __init__(
         self,
@@ -56,6 +62,10 @@ class SemanticContradictionEngine:
             os.getenv("SEMANTIC_TIMEOUT_SECONDS", self.DEFAULT_TIMEOUT_SECONDS)
         )
 
+        self.skip_threshold = float(
+            os.getenv("SEMANTIC_SKIP_THRESHOLD", self.DEFAULT_SKIP_THRESHOLD)
+        )
+
         self.api_key = os.getenv("GEMINI_API_KEY")
         self._configured = False
 
@@ -72,73 +82,144 @@ class SemanticContradictionEngine:
             self._configured = True
 
     # ==========================================================
-    # Cosine Similarity (Pure Python)
+    # Cosine Similarity (NumPy / BLAS)
     # ==========================================================
 
+    @staticmethod
+    def _normalize(arr: np.ndarray) -> np.ndarray:
+        norm = float(np.linalg.norm(arr))
+        if norm > 0.0:
+            arr /= norm
+        return arr
+
     @staticmethod
     def _cosine_similarity(
-        vec1: List[float],
-        vec2: List[float]
+        vec1: np.ndarray,
+        vec2: np.ndarray
     ) -> float:
 
-        dot = sum(a * b for a, b in zip(vec1, vec2))
-        norm1 = math.sqrt(sum(a * a for a in vec1))
-        norm2 = math.sqrt(sum(b * b for b in vec2))
-
-        if norm1 == 0.0 or norm2 == 0.0:
-            return 0.0
-
-        return dot / (norm1 * norm2)
+        # Vectors are unit-normalized at load time, so cosine is a
+        # single BLAS dot — no per-call norms or sqrts.
+        return float(vec1 @ vec2)
 
     # ==========================================================
     # DB CACHE LOOKUP
     # ==========================================================
 
-    def _get_cached_embedding(self, text: str) -> Optional[List[float]]:
+    def _get_cached_embedding(self, text: str) -> Optional[bytes]:
         return DBEmbeddingCache.get_embedding(
             db=self.db,
             text=text,
             tenant_id=self.tenant_id
         )
 
-    def _store_embedding(self, text: str, embedding: List[float]) -> None:
-        DBEmbeddingCache.store_embedding(
-            db=self.db,
-            text=text,
-            embedding=embedding,
-            tenant_id=self.tenant_id,
-            model_used=self.model
+    def _store_embedding(self, text: str, embedding: bytes) -> None:
+        # Write-behind: the durable tier is warmed off the request
+        # path instead of paying an INSERT + commit here. The memory
+        # cache already serves this row in the meantime.
+        embedding_writer.enqueue(
+            dict(
+                tenant_id=self.tenant_id,
+                content_hash=DBEmbeddingCache._hash_text(text, self.tenant_id),
+                original_text=text,
+                embedding=embedding,
+                model_used=self.model,
+            )
         )
 
     # ==========================================================
     # Embedding Generator
     # ==========================================================
 
-    def _get_embedding(self, text: str) -> List[float]:
-
-        # 1️⃣ Check DB cache
-        cached = self._get_cached_embedding(text)
-        if cached:
-            return cached
-
-        # 2️⃣ Call Gemini
-        self._configure()
+    def _get_embedding(self, text: str) -> np.ndarray:
+        return self._get_embeddings_batch([text])[0]
+
+    def _get_embeddings_batch(self, texts: List[str]) -> List[np.ndarray]:
+        """
+        Resolves every text through memory → DB → Gemini, issuing at
+        most one DB round trip and one Gemini RPC no matter how many
+        texts miss.
+        """
+
+        results: Dict[str, np.ndarray] = {}
+
+        # 1️⃣ In-memory cache already holds the converted ndarray,
+        #    so the list→float32 conversion is paid once per text.
+        #    get_many resolves the whole batch under one shard lock.
+        unique_texts = list(dict.fromkeys(texts))
+        misses: List[str] = []
+        for text, cached_arr in zip(
+            unique_texts,
+            MemoryEmbeddingCache.get_many(unique_texts, self.tenant_id),
+        ):
+            if cached_arr is not None:
+                results[text] = cached_arr
+            else:
+                misses.append(text)
+
+        # 2️⃣ One bulk DB query for the rest. Rows hold the
+        #    int8-quantized vector as raw bytes, decoded straight
+        #    into float32 via frombuffer.
+        if misses:
+            db_hits = DBEmbeddingCache.get_embeddings(
+                db=self.db,
+                texts=misses,
+                tenant_id=self.tenant_id
+            )
 
-        response = genai.embed_content(
-            model=self.model,
-            content=text,
-            task_type="retrieval_document"
-        )
+            remaining: List[str] = []
+            for text in misses:
+                cached = db_hits.get(text)
+                if cached:
+                    arr = (
+                        np.frombuffer(cached, dtype=np.int8)
+                        .astype(np.float32)
+                        / 127.0
+                    )
+
+                    arr = self._normalize(arr)
+                    MemoryEmbeddingCache.set(text, arr, self.tenant_id)
+                    results[text] = arr
+                else:
+                    remaining.append(text)
+            misses = remaining
+
+        # 3️⃣ One Gemini RPC for everything still missing — the API
+        #    accepts a list of contents and returns one vector each
+        if misses:
+            self._configure()
+
+            response = genai.embed_content(
+                model=self.model,
+                content=misses,
+                task_type="retrieval_document"
+            )
 
-        embedding = response.get("embedding")
+            embeddings = response.get("embedding")
+
+            if (
+                not isinstance(embeddings, list)
+                or len(embeddings) != len(misses)
+            ):
+                raise ValueError("Invalid embedding response format.")
+
+            # 4️⃣ Persist in DB + memory. The DB copy is int8-quantized
+            #    (unit vector × 127) stored as one BYTEA byte per
+            #    component; quantization error (~0.004/component) is
+            #    far below the 0.60/0.75 risk thresholds. Memory keeps
+            #    the exact normalized float32.
+            for text, embedding in zip(misses, embeddings):
+                arr = self._normalize(
+                    np.asarray(embedding, dtype=np.float32)
+                )
 
-        if not embedding or not isinstance(embedding, list):
-            raise ValueError("Invalid embedding response format.")
+                quantized = np.round(arr * 127.0).astype(np.int8)
+                self._store_embedding(text, quantized.tobytes())
 
-        # 3️⃣ Persist in DB
-        self._store_embedding(text, embedding)
+                MemoryEmbeddingCache.set(text, arr, self.tenant_id)
+                results[text] = arr
 
-        return embedding
+        return [results[text] for text in texts]
 
     # ==========================================================
     # Main Evaluation
@@ -147,7 +228,8 @@ class SemanticContradictionEngine:
     def evaluate(
         self,
         context: List[str],
-        response: str
+        response: str,
+        grounding_score: Optional[float] = None
     ) -> Dict:
 
         if not self.enabled:
@@ -159,6 +241,27 @@ class SemanticContradictionEngine:
                 "model_used": None
             }
 
+        # --------------------------------------------
+        # Strong-Grounding Short-Circuit
+        # --------------------------------------------
+        # Well above the 0.75 medium threshold, semantic risk is
+        # negligible — skip the embedding round trip entirely.
+        if (
+            grounding_score is not None
+            and grounding_score >= self.skip_threshold
+        ):
+            SemanticContradictionEngine.skipped_count += 1
+            return {
+                "similarity_score": None,
+                "semantic_risk": False,
+                "severity": "SKIPPED",
+                "explanation": (
+                    f"Skipped: grounding score {grounding_score} "
+                    f">= {self.skip_threshold}."
+                ),
+                "model_used": None
+            }
+
         try:
             start_time = time.time()
 
@@ -183,10 +286,11 @@ class SemanticContradictionEngine:
                 raise TimeoutError("Semantic evaluation timeout.")
 
             # --------------------------------------------
-            # Get embeddings (DB cached)
+            # Get embeddings (DB cached, one RPC for misses)
             # --------------------------------------------
-            context_embedding = self._get_embedding(combined_context)
-            response_embedding = self._get_embedding(response)
+            context_embedding, response_embedding = (
+                self._get_embeddings_batch([combined_context, response])
+            )
 
             similarity = self._cosine_similarity(
                 context_embedding,
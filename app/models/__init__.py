@@ -16,6 +16,7 @@ from .api_key import TenantAPIKey
 from .usage_meter import UsageMeter
 from .pricing_plan import PricingPlan
 from .embedding_cache import EmbeddingCache
+from .processed_stripe_event import ProcessedStripeEvent
 
 __all__ = [
     "EvaluationLog",
@@ -25,4 +26,5 @@ __all__ = [
     "UsageMeter",
     "PricingPlan",
     "EmbeddingCache",   # ✅ important for Alembic detection
+    "ProcessedStripeEvent",
 ]
\ No newline at end of file
@@ -5,8 +5,10 @@ from sqlalchemy import (
     Boolean,
     DateTime,
     ForeignKey,
-    Index
+    Index,
+    text
 )
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
 
@@ -33,13 +35,16 @@ class TenantAPIKey(Base):
     # ---------------------------------------------------
     # Tenant Association
     # ---------------------------------------------------
+    # idx_tenant_env / idx_key_status both lead with tenant_id, so
+    # no separate single-column index
     tenant_id = Column(
         String(100),
         ForeignKey("tenants.tenant_id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
+    tenant = relationship("Tenant")
+
     # ---------------------------------------------------
     # API Key Details
     # ---------------------------------------------------
@@ -89,4 +94,14 @@ class TenantAPIKey(Base):
     __table_args__ = (
         Index("idx_tenant_env", "tenant_id", "environment"),
         Index("idx_key_status", "tenant_id", "is_active"),
+
+        # Auth looks up by prefix among live keys only; the partial
+        # unique index keeps that an index scan and guarantees no two
+        # active keys ever share a prefix (~54 bits of entropy).
+        Index(
+            "ix_api_keys_prefix_active",
+            "key_prefix",
+            unique=True,
+            postgresql_where=text("is_active AND NOT is_revoked"),
+        ),
     )
\ No newline at end of file
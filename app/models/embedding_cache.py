@@ -1,8 +1,22 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float
-from sqlalchemy.dialects.postgresql import JSONB
+import hashlib
+from typing import List, Optional
+
+from sqlalchemy import (
+    Column,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    DateTime,
+    bindparam,
+    select,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
 from sqlalchemy.sql import func
 
 from app.core.database import Base
+from app.core.embedding_hit_tracker import embedding_hit_tracker
 
 
 class EmbeddingCache(Base):
@@ -25,8 +39,9 @@ class EmbeddingCache(Base):
     # Original text (optional but useful for debugging)
     original_text = Column(Text, nullable=False)
 
-    # Store embedding as JSON array
-    embedding = Column(JSONB, nullable=False)
+    # int8-quantized vector as raw bytes (BYTEA) — one byte per
+    # component, loaded zero-copy with np.frombuffer
+    embedding = Column(LargeBinary, nullable=False)
 
     # Metadata
     model_used = Column(String, nullable=True)
@@ -34,4 +49,120 @@ class EmbeddingCache(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     last_accessed = Column(DateTime(timezone=True), server_default=func.now())
 
-    hit_count = Column(Integer, default=0)
\ No newline at end of file
+    hit_count = Column(Integer, default=0)
+
+    __table_args__ = (
+        # Covering index: lookups are hash → embedding, and INCLUDE
+        # lets them complete as index-only scans instead of a B-tree
+        # probe plus a heap fetch per row
+        Index(
+            "idx_embcache_hash_covering",
+            "content_hash",
+            postgresql_include=["embedding", "model_used"],
+        ),
+    )
+
+    # ==========================================================
+    # Cache Access Helpers
+    # ==========================================================
+
+    @staticmethod
+    def _hash_text(text: str, tenant_id: Optional[str]) -> str:
+        base = f"{tenant_id or ''}:{text}"
+        return hashlib.sha256(base.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def get_embedding(
+        cls,
+        db,
+        text: str,
+        tenant_id: Optional[str] = None
+    ) -> Optional[bytes]:
+        """
+        Returns the cached embedding for this tenant/text, or None.
+        """
+
+        content_hash = cls._hash_text(text, tenant_id)
+
+        row = db.query(cls).filter(
+            cls.content_hash == content_hash
+        ).first()
+
+        if row is None:
+            return None
+
+        embedding_hit_tracker.record_hits((content_hash,))
+        return row.embedding
+
+    @classmethod
+    def get_embeddings(
+        cls,
+        db,
+        texts: List[str],
+        tenant_id: Optional[str] = None
+    ) -> dict:
+        """
+        Bulk lookup: returns {text: embedding} for every cache hit.
+        One round trip regardless of how many texts are asked for.
+        """
+
+        hash_to_text = {
+            cls._hash_text(text, tenant_id): text for text in texts
+        }
+
+        rows = db.execute(
+            _bulk_get_stmt, {"hashes": list(hash_to_text)}
+        ).all()
+
+        if rows:
+            # Deferred: the hit tracker batches the hit_count /
+            # last_accessed bumps off the lookup path
+            embedding_hit_tracker.record_hits(
+                content_hash for content_hash, _ in rows
+            )
+
+        return {
+            hash_to_text[content_hash]: embedding
+            for content_hash, embedding in rows
+        }
+
+    @classmethod
+    def store_embedding(
+        cls,
+        db,
+        text: str,
+        embedding: bytes,
+        tenant_id: Optional[str] = None,
+        model_used: Optional[str] = None
+    ) -> None:
+        """
+        Persists an embedding. Duplicate hashes are left as-is.
+        """
+
+        # One round-trip upsert; ON CONFLICT DO NOTHING replaces the
+        # old exists-check + INSERT pair and is race-free under
+        # concurrent writers hashing the same text
+        db.execute(
+            pg_insert(cls)
+            .values(
+                tenant_id=tenant_id,
+                content_hash=cls._hash_text(text, tenant_id),
+                original_text=text,
+                embedding=embedding,
+                model_used=model_used,
+            )
+            .on_conflict_do_nothing(index_elements=["content_hash"])
+        )
+        db.commit()
+
+
+# Prepared once at import: a single ANY(:hashes) array parameter
+# keeps the statement text stable for the compiled-statement cache
+# no matter how many hashes are looked up.
+_bulk_get_stmt = select(
+    EmbeddingCache.content_hash,
+    EmbeddingCache.embedding,
+).where(
+    EmbeddingCache.content_hash
+    == func.any(bindparam("hashes", type_=ARRAY(String(64))))
+)
\ No newline at end of file
@@ -1,4 +1,5 @@
 from sqlalchemy import (
+    BigInteger,
     Column,
     Integer,
     String,
@@ -6,12 +7,14 @@ from sqlalchemy import (
     Text,
     DateTime,
     Boolean,
-    JSON,
     Index,
+    LargeBinary,
     UniqueConstraint,
     ForeignKey,
-    Numeric
+    Numeric,
+    text
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -35,21 +38,29 @@ class EvaluationLog(Base):
     # ===================================================
     # PRIMARY KEY
     # ===================================================
-    id = Column(Integer, primary_key=True, index=True)
+    # BigInteger: an append-only audit table crosses the int4 ceiling
+    # (~2.1B rows) well within the retention window at production
+    # volume, and widening later means rewriting the table under load
+    id = Column(BigInteger, primary_key=True, index=True)
 
     # ===================================================
     # TENANT & CONTEXT
     # ===================================================
+    # No single-column index: every composite below leads with
+    # tenant_id, and Postgres uses a composite's leading column for
+    # single-column predicates
     tenant_id = Column(
         String(100),
         ForeignKey("tenants.tenant_id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
-    tenant = relationship("Tenant")
+    # No caller walks log → tenant today; raise on accidental lazy
+    # access so a bulk analytics query can never silently N+1 —
+    # opt in with selectinload(EvaluationLog.tenant) where needed
+    tenant = relationship("Tenant", lazy="raise")
 
-    app_name = Column(String(100), nullable=False, index=True)
+    app_name = Column(String(100), nullable=False)  # idx_app_created leads with it
     environment = Column(String(50), default="production", index=True)
 
     # Optional reference to API key used
@@ -72,7 +83,7 @@ class EvaluationLog(Base):
     # CORE TRUST SCORES
     # ===================================================
     # ⚠ Changed to Float for precision
-    trust_score = Column(Float, nullable=False, index=True)
+    trust_score = Column(Float, nullable=False)  # idx_trust_score_date leads with it
 
     hallucination_probability = Column(Float, nullable=False)
     grounding_score = Column(Float, nullable=False)
@@ -80,9 +91,9 @@ class EvaluationLog(Base):
     # ===================================================
     # BUSINESS RISK LAYER
     # ===================================================
-    business_risk = Column(String(20), nullable=False, index=True)
+    business_risk = Column(String(20), nullable=False)  # idx_risk_recommendation leads with it
     risk_score = Column(Integer, nullable=True)
-    triggered_keywords = Column(JSON, nullable=True)
+    triggered_keywords = Column(JSONB, nullable=True)
 
     # ===================================================
     # NUMERIC CONFLICT LAYER
@@ -121,14 +132,14 @@ class EvaluationLog(Base):
     # ===================================================
     # EXPLAINABILITY
     # ===================================================
-    score_breakdown = Column(JSON, nullable=True)
-    explanations = Column(JSON, nullable=True)
+    score_breakdown = Column(JSONB, nullable=True)
+    explanations = Column(JSONB, nullable=True)
 
     # ===================================================
     # RAW INPUTS (Replayable AI Audit)
     # ===================================================
     user_query = Column(Text, nullable=False)
-    retrieved_context = Column(JSON, nullable=True)
+    retrieved_context = Column(JSONB, nullable=True)
     llm_response = Column(Text, nullable=False)
 
     # ===================================================
@@ -136,7 +147,9 @@ class EvaluationLog(Base):
     # ===================================================
     atlas_version = Column(String(20), default="0.3.1")
 
-    request_hash = Column(String(64), nullable=False)
+    # Raw 32-byte blake2b digest — half the hex-string footprint in
+    # both the row and the dedupe unique index
+    request_hash = Column(LargeBinary(32), nullable=False)
     evaluation_latency_ms = Column(Integer, nullable=True)
 
     config_version = Column(Integer, nullable=True)
@@ -156,11 +169,22 @@ class EvaluationLog(Base):
     # ===================================================
     __table_args__ = (
 
+        # The hot lookups only ever want live rows, so the read-path
+        # indexes are partial on is_deleted = false: >99% of rows are
+        # live, but the predicate keeps every soft-deleted row out of
+        # the B-tree instead of indexed as dead weight.
+
         # Per-app analytics
-        Index("idx_app_created", "app_name", "created_at"),
+        Index(
+            "idx_app_created", "app_name", "created_at",
+            postgresql_where=text("is_deleted = false")
+        ),
 
         # Tenant + app drilldown
-        Index("idx_tenant_app_date", "tenant_id", "app_name", "created_at"),
+        Index(
+            "idx_tenant_app_date", "tenant_id", "app_name", "created_at",
+            postgresql_where=text("is_deleted = false")
+        ),
 
         # Risk analytics
         Index("idx_risk_recommendation", "business_risk", "recommendation"),
@@ -169,10 +193,37 @@ class EvaluationLog(Base):
         Index("idx_trust_score_date", "trust_score", "created_at"),
 
         # Tenant billing queries
-        Index("idx_tenant_created", "tenant_id", "created_at"),
+        Index(
+            "idx_tenant_created", "tenant_id", "created_at",
+            postgresql_where=text("is_deleted = false")
+        ),
+
+        # Dashboard aggregates (BLOCK/WARN/ALLOW counts per tenant)
+        Index("idx_tenant_recommendation", "tenant_id", "recommendation"),
 
-        # Soft delete optimization
-        Index("idx_tenant_active_logs", "tenant_id", "is_deleted"),
+        # Keyword drilldowns (JSONB containment, e.g. @> '["legal"]')
+        Index(
+            "idx_eval_triggered_kw_gin", "triggered_keywords",
+            postgresql_using="gin"
+        ),
+
+        # Long-range time aggregates: the table is append-only, so
+        # rows are physically clustered by created_at and a BRIN
+        # index covers wide date windows in kilobytes instead of a
+        # full B-tree; the composite B-trees above still serve
+        # short per-tenant windows
+        Index(
+            "idx_eval_created_brin", "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": "32"}
+        ),
+
+        # Soft delete optimization — the partial predicate replaces
+        # the old is_deleted key column
+        Index(
+            "idx_tenant_active_logs", "tenant_id",
+            postgresql_where=text("is_deleted = false")
+        ),
 
         # Deduplication safety
         UniqueConstraint(
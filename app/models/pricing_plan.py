@@ -5,9 +5,10 @@ from sqlalchemy import (
     Boolean,
     Numeric,
     DateTime,
-    JSON,
-    Index
+    Index,
+    text
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -42,6 +43,9 @@ class PricingPlan(Base):
 
     is_active = Column(Boolean, default=True, nullable=False, index=True)
 
+    # Stripe price backing this plan (webhook lookups)
+    stripe_price_id = Column(String(255), nullable=True, index=True)
+
     # ---------------------------------------------------
     # Pricing (Precise Money Handling)
     # ---------------------------------------------------
@@ -75,17 +79,21 @@ class PricingPlan(Base):
 
     # ---------------------------------------------------
     # Feature Flags
-    # IMPORTANT: Never use mutable dict directly as default
+    # JSONB (parsed once at write, not on every plan fetch) with the
+    # default applied server-side so inserts don't round-trip the
+    # dict through Python — and it can never be a shared mutable
     # ---------------------------------------------------
     features = Column(
-        JSON,
+        JSONB,
         nullable=False,
-        default=lambda: {
-            "semantic_enabled": True,
-            "confidence_layer_enabled": True,
-            "advanced_analytics": False,
-            "priority_support": False,
-        }
+        server_default=text(
+            "'{"
+            '"semantic_enabled": true, '
+            '"confidence_layer_enabled": true, '
+            '"advanced_analytics": false, '
+            '"priority_support": false'
+            "}'::jsonb"
+        )
     )
 
     # ---------------------------------------------------
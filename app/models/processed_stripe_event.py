@@ -0,0 +1,23 @@
+from sqlalchemy import Column, String, DateTime
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class ProcessedStripeEvent(Base):
+    """
+    Idempotency ledger for Stripe webhook deliveries.
+
+    Stripe re-delivers events on any non-2xx (and occasionally on
+    success). The first handler to insert an event id processes it;
+    later deliveries hit the primary key and are acked as duplicates.
+    """
+
+    __tablename__ = "processed_stripe_events"
+
+    event_id = Column(String(255), primary_key=True)
+
+    created_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        index=True
+    )
@@ -57,10 +57,12 @@ class Tenant(Base):
         nullable=False
     )
 
+    # Lazy by default — auth opts into the join explicitly via
+    # joinedload, so tenant lookups that never touch the plan
+    # (Stripe linkage, usage flushes) skip the pricing_plans JOIN
     pricing_plan = relationship(
         "PricingPlan",
-        back_populates="tenants",
-        lazy="joined"
+        back_populates="tenants"
     )
 
     # ===================================================
@@ -104,6 +106,21 @@ class Tenant(Base):
         nullable=True
     )
 
+    # ===================================================
+    # STRIPE LINKAGE
+    # ===================================================
+    stripe_customer_id = Column(
+        String(255),
+        unique=True,
+        nullable=True,
+        index=True
+    )
+
+    stripe_subscription_id = Column(
+        String(255),
+        nullable=True
+    )
+
     # ===================================================
     # SUBSCRIPTION STATUS
     # ===================================================
@@ -160,12 +177,9 @@ class Tenant(Base):
     # ===================================================
     __table_args__ = (
 
-        # 🔥 Renamed — globally unique
-        Index(
-            "idx_tenants_tenant_active",
-            "tenant_id",
-            "is_active"
-        ),
+        # tenant_id already has a unique index; a point lookup plus
+        # the is_active check needs nothing more, so the old
+        # (tenant_id, is_active) composite was dropped as redundant
 
         Index(
             "idx_tenants_plan_active",
@@ -16,7 +16,18 @@ class AnalyticsService:
         end_date: Optional[datetime] = None,
     ):
 
-        query = db.query(EvaluationLog)
+        # One aggregate query instead of four (count / avg / two
+        # filtered counts): one round trip, one scan, same numbers.
+        # COUNT(*) FILTER evaluates each predicate inline during the
+        # single pass — no per-row CASE expression materialized.
+        query = db.query(
+            func.count(EvaluationLog.id),
+            func.avg(EvaluationLog.trust_score),
+            func.count()
+            .filter(EvaluationLog.recommendation == "BLOCK"),
+            func.count()
+            .filter(EvaluationLog.business_risk == "HIGH"),
+        )
 
         if app_name:
             query = query.filter(EvaluationLog.app_name == app_name)
@@ -27,7 +38,9 @@ class AnalyticsService:
         if end_date:
             query = query.filter(EvaluationLog.created_at <= end_date)
 
-        total_requests = query.count()
+        total_requests, avg_trust_score, block_count, high_risk_count = (
+            query.one()
+        )
 
         if total_requests == 0:
             return {
@@ -37,21 +50,9 @@ class AnalyticsService:
                 "high_risk_rate": None,
             }
 
-        avg_trust_score = query.with_entities(
-            func.avg(EvaluationLog.trust_score)
-        ).scalar()
-
-        block_count = query.filter(
-            EvaluationLog.recommendation == "BLOCK"
-        ).count()
-
-        high_risk_count = query.filter(
-            EvaluationLog.business_risk == "HIGH"
-        ).count()
-
         return {
             "total_requests": total_requests,
-            "avg_trust_score": round(avg_trust_score, 2),
+            "avg_trust_score": round(float(avg_trust_score), 2),
             "block_rate": round(block_count / total_requests, 2),
             "high_risk_rate": round(high_risk_count / total_requests, 2),
         }
\ No newline at end of file
@@ -1,10 +1,81 @@
 import hashlib
+import heapq
 import time
 import threading
 import os
 import sys
-from typing import Dict, List, Optional, Tuple
-from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, Hashable, List, Optional, Union
+
+import numpy as np
+
+
+def _parse_tenant_targets(raw: str) -> Dict[str, float]:
+    """
+    Parses EMBED_CACHE_TENANT_TARGETS ("tenant-a:0.9,tenant-b:0.5")
+    into {tenant_id: target_hit_ratio}. Malformed entries are skipped.
+    """
+    targets: Dict[str, float] = {}
+    for part in raw.split(","):
+        if ":" not in part:
+            continue
+        tenant, _, ratio = part.rpartition(":")
+        try:
+            targets[tenant.strip()] = float(ratio)
+        except ValueError:
+            continue
+    return targets
+
+
+# Lookup table for halving every counter byte in one C-level pass
+_HALVE = bytes(v >> 1 for v in range(256))
+
+
+class _CountMinSketch:
+    """
+    Approximate frequency counter backing cache admission.
+
+    4 rows x 16384 8-bit saturating counters (~64 KB) — negligible
+    next to the embeddings it protects. Counters halve periodically
+    ("aging") so stale popularity decays instead of pinning entries
+    forever.
+    """
+
+    ROWS = 4
+    WIDTH = 1 << 14  # power of two so slot selection is a mask
+    AGE_EVERY = WIDTH * 8
+
+    __slots__ = ("rows", "increments")
+
+    def __init__(self):
+        self.rows = [bytearray(self.WIDTH) for _ in range(self.ROWS)]
+        self.increments = 0
+
+    def add(self, key: Hashable) -> int:
+        """
+        Record one occurrence. Returns the updated estimate.
+        """
+        estimate = 255
+        for seed, row in enumerate(self.rows):
+            slot = hash((seed, key)) & (self.WIDTH - 1)
+            if row[slot] < 255:
+                row[slot] += 1
+            if row[slot] < estimate:
+                estimate = row[slot]
+
+        self.increments += 1
+        if self.increments >= self.AGE_EVERY:
+            self.increments = 0
+            for row in self.rows:
+                row[:] = row.translate(_HALVE)
+
+        return estimate
+
+    def estimate(self, key: Hashable) -> int:
+        return min(
+            row[hash((seed, key)) & (self.WIDTH - 1)]
+            for seed, row in enumerate(self.rows)
+        )
 
 
 class EmbeddingCache:
@@ -12,9 +83,9 @@ class EmbeddingCache:
     Enterprise-grade in-memory embedding cache.
 
     Features:
-    - LRU eviction
+    - Lazy LRU eviction (amortized, nothing reordered on reads)
     - TTL expiration
-    - Thread-safe (RLock)
+    - Sharded by tenant (one non-reentrant Lock per shard)
     - Tenant isolation
     - Configurable via ENV
     - Hit/miss statistics
@@ -34,16 +105,95 @@ class EmbeddingCache:
     # Optional hard memory cap (MB) — 0 disables
     MAX_MEMORY_MB = float(os.getenv("EMBED_CACHE_MAX_MEMORY_MB", "0"))
 
+    # Texts up to this length key the dict directly; longer ones fall
+    # back to a digest so the cache doesn't pin megabyte strings alive
+    KEY_TEXT_MAX_CHARS = int(os.getenv("EMBED_CACHE_KEY_TEXT_MAX_CHARS", "512"))
+
+    # Rounded up to a power of two so shard selection is a bit mask
+    SHARD_COUNT = 1 << (
+        max(1, int(os.getenv("EMBED_CACHE_SHARDS", "16"))) - 1
+    ).bit_length()
+
+    # Max-Min fairness: per-tenant target hit ratios. When tenants
+    # sharing a shard force an eviction, entries go first from the
+    # tenant whose measured hit ratio most exceeds its target — the
+    # one that can best afford the loss — so cache capacity flows
+    # toward tenants still below their target instead of whoever
+    # happens to insert fastest.
+    TENANT_TARGETS = _parse_tenant_targets(
+        os.getenv("EMBED_CACHE_TENANT_TARGETS", "")
+    )
+    DEFAULT_TENANT_TARGET = float(
+        os.getenv("EMBED_CACHE_DEFAULT_TENANT_TARGET", "0.5")
+    )
+
+    # Optional int8 storage: 1 byte per component instead of 4,
+    # quartering embedding memory again at ~0.4% peak quantization
+    # error — invisible to the similarity thresholds downstream.
+    # Reads dequantize, so callers always see float32.
+    QUANTIZE_INT8 = os.getenv("EMBED_CACHE_QUANTIZE", "").lower() == "int8"
+
+    # TinyLFU admission: once a shard is at its size share, a new
+    # entry must have been asked for at least this many times (per
+    # the sketch) before it may displace cached ones. Keeps one-hit
+    # prompts from churning the hot set. 0 disables the filter.
+    ADMIT_MIN_FREQ = int(os.getenv("EMBED_CACHE_ADMIT_MIN_FREQ", "2"))
+
     # ==========================================================
-    # Internal Storage
-    # key → (embedding, timestamp)
+    # Internal Storage (per shard)
+    # key → [embedding, timestamp, tick, entry_bytes, scale]
+    # (scale is None for float32 entries, the int8 dequant factor
+    # otherwise)
+    #
+    # Recency is a monotonic tick per entry instead of OrderedDict
+    # ordering: a hit just rewrites one int in place, where
+    # move_to_end relinked the entry on every read. Eviction sweeps
+    # lazily once a shard doubles past its size share, so its cost
+    # is amortized O(1) per insert.
+    #
+    # One global lock serialized all tenants; a tenant's entries now
+    # live in hash(tenant_id)-selected shards, each with its own
+    # plain Lock (not RLock — no method reenters, and skipping the
+    # owner bookkeeping shaves every acquire), so concurrent tenant
+    # traffic proceeds in parallel.
     # ==========================================================
 
-    _cache: "OrderedDict[str, Tuple[List[float], float]]" = OrderedDict()
-    _lock = threading.RLock()
-
-    _hits = 0
-    _misses = 0
+    _shards: "List[dict[Hashable, list]]" = [
+        {} for _ in range(SHARD_COUNT)
+    ]
+    _locks = [threading.Lock() for _ in range(SHARD_COUNT)]
+    _ticks = [0] * SHARD_COUNT
+
+    # Running per-shard totals of entry sizes — each entry remembers
+    # its own byte count, so the memory estimate is a short sum
+    # instead of a walk over every cached array
+    _bytes_used = [0] * SHARD_COUNT
+
+    _hits = [0] * SHARD_COUNT
+    _misses = [0] * SHARD_COUNT
+
+    # Per-tenant hit/miss tallies feeding the Max-Min eviction. A
+    # tenant maps to exactly one shard, so its counters are only ever
+    # touched under that shard's lock.
+    _tenant_hits: Dict[Optional[str], int] = {}
+    _tenant_misses: Dict[Optional[str], int] = {}
+
+    # One frequency sketch per shard (same locking story as above)
+    _sketches = [_CountMinSketch() for _ in range(SHARD_COUNT)]
+
+    # In-flight loads keyed like the cache, so concurrent misses on
+    # the same text coalesce into one loader call (guarded by the
+    # key's shard lock)
+    _pending: Dict[Hashable, Future] = {}
+
+    # Min-heap of (expires_at, tick, key, timestamp) per shard so
+    # pruning stops at the first still-live record instead of
+    # scanning every entry. The unique tick breaks expires_at ties
+    # before the key is ever compared (keys holding None aren't
+    # orderable). Records for overwritten or evicted entries are
+    # skipped on pop by comparing the stored timestamp to the live
+    # one.
+    _expiry_heaps: "List[list]" = [[] for _ in range(SHARD_COUNT)]
 
     # ==========================================================
     # Utilities
@@ -53,13 +203,66 @@ class EmbeddingCache:
     def _hash_text(text: str, tenant_id: Optional[str] = None) -> str:
         """
         Tenant-aware hash prevents cross-tenant leakage.
+
+        blake2b with an 8-byte digest: cache keys have no adversarial
+        exposure, so a short non-crypto-strength digest is fine and
+        hashes noticeably faster than sha256. The 16-char hex key also
+        carries 48 bytes less per entry than the old sha256 hex. The
+        NUL separator keeps the tenant_id boundary unambiguous.
+
+        Fed to the hasher in pieces: only long texts reach this
+        method, and streaming the parts skips building (and encoding)
+        a concatenated copy of the whole text first.
+        """
+        h = hashlib.blake2b(digest_size=8)
+        if tenant_id:
+            h.update(tenant_id.encode("utf-8"))
+        h.update(b"\x00")
+        h.update(text.encode("utf-8"))
+        return h.hexdigest()
+
+    @classmethod
+    def _make_key(cls, text: str, tenant_id: Optional[str]) -> Hashable:
+        """
+        Cache key for a tenant/text pair.
+
+        Short texts key the dict as a (tenant_id, text) tuple — no
+        hashing at all on the hot path, since CPython caches a str's
+        hash on the object after first use, so repeated lookups of
+        the same interned texts are pointer-compare fast. Only texts
+        past KEY_TEXT_MAX_CHARS pay for a digest, to avoid keeping
+        very large strings alive as keys.
+        """
+        # Both forms keep tenant_id as element 0 so eviction can
+        # attribute every entry to its tenant
+        if len(text) <= cls.KEY_TEXT_MAX_CHARS:
+            return (tenant_id, text)
+        return (tenant_id, cls._hash_text(text, tenant_id))
+
+    @classmethod
+    def _shard_for(cls, tenant_id: Optional[str]) -> int:
+        # Power-of-two mask instead of modulo; all of one tenant's
+        # traffic maps to one shard, so tenants contend only on hash
+        # collisions
+        return hash(tenant_id) & (cls.SHARD_COUNT - 1)
+
+    @staticmethod
+    def _entry_value(item: list) -> np.ndarray:
         """
-        base = f"{tenant_id or ''}:{text}"
-        return hashlib.sha256(base.encode("utf-8")).hexdigest()
+        Embedding as float32, dequantizing int8 entries on the fly
+        (one vectorized multiply — a few microseconds per vector).
+        """
+        if item[4] is None:
+            return item[0]
+        return item[0].astype(np.float32) * item[4]
 
     @classmethod
     def _is_expired(cls, timestamp: float) -> bool:
-        return (time.time() - timestamp) > cls.TTL_SECONDS
+        # Monotonic clock: cheaper to read than wall time and immune
+        # to NTP/DST jumps, which could mass-expire (or immortalize)
+        # entries mid-flight. Entry timestamps are monotonic values
+        # and never leave the process.
+        return (time.monotonic() - timestamp) > cls.TTL_SECONDS
 
     # ==========================================================
     # GET
@@ -70,30 +273,46 @@ class EmbeddingCache:
         cls,
         text: str,
         tenant_id: Optional[str] = None
-    ) -> Optional[List[float]]:
+    ) -> Optional[np.ndarray]:
 
         if not cls.ENABLED:
             return None
 
-        key = cls._hash_text(text, tenant_id)
-
-        with cls._lock:
-            item = cls._cache.get(key)
-
-            if not item:
-                cls._misses += 1
+        key = cls._make_key(text, tenant_id)
+        idx = cls._shard_for(tenant_id)
+        shard = cls._shards[idx]
+
+        with cls._locks[idx]:
+            item = shard.get(key)
+
+            if item is None:
+                # Every miss registers demand with the sketch, so by
+                # the time set() runs the key's frequency is known
+                cls._sketches[idx].add(key)
+                cls._misses[idx] += 1
+                cls._tenant_misses[tenant_id] = (
+                    cls._tenant_misses.get(tenant_id, 0) + 1
+                )
                 return None
 
-            embedding, timestamp = item
-
-            if cls._is_expired(timestamp):
-                cls._cache.pop(key, None)
-                cls._misses += 1
+            if cls._is_expired(item[1]):
+                cls._delete_entry(idx, key)
+                cls._sketches[idx].add(key)
+                cls._misses[idx] += 1
+                cls._tenant_misses[tenant_id] = (
+                    cls._tenant_misses.get(tenant_id, 0) + 1
+                )
                 return None
 
-            cls._cache.move_to_end(key)
-            cls._hits += 1
-            return embedding
+            # Recency bump: one int store, no dict relinking
+            cls._ticks[idx] += 1
+            item[2] = cls._ticks[idx]
+
+            cls._hits[idx] += 1
+            cls._tenant_hits[tenant_id] = (
+                cls._tenant_hits.get(tenant_id, 0) + 1
+            )
+            return cls._entry_value(item)
 
     # ==========================================================
     # SET
@@ -103,27 +322,315 @@ class EmbeddingCache:
     def set(
         cls,
         text: str,
-        embedding: List[float],
+        embedding: Union[np.ndarray, List[float]],
         tenant_id: Optional[str] = None
     ) -> None:
 
         if not cls.ENABLED:
             return
 
-        key = cls._hash_text(text, tenant_id)
+        key = cls._make_key(text, tenant_id)
+        idx = cls._shard_for(tenant_id)
+
+        prepared = cls._prepare_value(embedding)
+
+        with cls._locks[idx]:
+            cls._insert(idx, key, prepared)
+            cls._enforce_limits(idx)
+
+    @classmethod
+    def _prepare_value(
+        cls,
+        embedding: Union[np.ndarray, List[float]],
+    ) -> tuple:
+        """
+        Converts a raw embedding into its stored form outside any
+        lock. Returns (array, scale).
+        """
+
+        # float32 ndarray: 4 bytes per component instead of a boxed
+        # PyFloat per value (~28 bytes) — a 1536-dim vector drops from
+        # ~44 KB to 6 KB. No copy when the caller already passes one.
+        embedding = np.asarray(embedding, dtype=np.float32)
+
+        # Optional int8 step shrinks that 6 KB to 1.5 KB
+        scale = None
+        if cls.QUANTIZE_INT8 and embedding.size:
+            peak = float(np.max(np.abs(embedding)))
+            if peak > 0.0:
+                scale = peak / 127.0
+                embedding = np.round(embedding / scale).astype(np.int8)
+
+        return embedding, scale
+
+    @classmethod
+    def _insert(cls, idx: int, key: Hashable, prepared: tuple) -> None:
+        """
+        Places one prepared value into its shard.
+        Caller must hold the shard lock.
+        """
+        shard = cls._shards[idx]
+        embedding, scale = prepared
+
+        # Admission filter: a full shard only accepts keys the
+        # sketch has seen often enough — one-hit wonders stay out
+        # rather than displacing proven entries
+        shard_max = max(1, cls.MAX_SIZE // cls.SHARD_COUNT)
+        if (
+            cls.ADMIT_MIN_FREQ > 0
+            and len(shard) >= shard_max
+            and key not in shard
+            and cls._sketches[idx].estimate(key) < cls.ADMIT_MIN_FREQ
+        ):
+            return
+
+        entry_bytes = (
+            sys.getsizeof(key) + embedding.nbytes + sys.getsizeof(embedding)
+        )
+
+        # Overwrites must not double-count the old entry
+        old = shard.get(key)
+        if old is not None:
+            cls._bytes_used[idx] -= old[3]
 
-        with cls._lock:
-            cls._cache[key] = (embedding, time.time())
-            cls._cache.move_to_end(key)
+        now = time.monotonic()
+        cls._ticks[idx] += 1
+        shard[key] = [embedding, now, cls._ticks[idx], entry_bytes, scale]
+        cls._bytes_used[idx] += entry_bytes
 
-            # LRU size enforcement
-            while len(cls._cache) > cls.MAX_SIZE:
-                cls._cache.popitem(last=False)
+        heapq.heappush(
+            cls._expiry_heaps[idx],
+            (now + cls.TTL_SECONDS, cls._ticks[idx], key, now),
+        )
 
-            # Memory cap enforcement (if enabled)
-            if cls.MAX_MEMORY_MB > 0:
-                while cls._estimate_memory_mb() > cls.MAX_MEMORY_MB:
-                    cls._cache.popitem(last=False)
+    @classmethod
+    def _enforce_limits(cls, idx: int) -> None:
+        """
+        Settles size and memory limits for one shard.
+        Caller must hold the shard lock.
+        """
+        shard = cls._shards[idx]
+        shard_max = max(1, cls.MAX_SIZE // cls.SHARD_COUNT)
+
+        # Lazy LRU: let the shard grow to 2x its share, then one
+        # sweep drops the coldest half — amortized O(1) per set
+        if len(shard) >= 2 * shard_max:
+            cls._evict_lru(idx, shard_max)
+
+        # Memory cap enforcement (if enabled) — the running byte
+        # counter makes each check O(1), and one coldest-first pass
+        # frees everything needed instead of re-scanning the shard
+        # with min() per evicted entry
+        if cls.MAX_MEMORY_MB > 0:
+            shard_cap_bytes = (
+                cls.MAX_MEMORY_MB / cls.SHARD_COUNT * 1024 * 1024
+            )
+            if cls._bytes_used[idx] > shard_cap_bytes:
+                for key, _ in sorted(
+                    shard.items(), key=lambda kv: kv[1][2]
+                ):
+                    if cls._bytes_used[idx] <= shard_cap_bytes:
+                        break
+                    cls._delete_entry(idx, key)
+
+    # ==========================================================
+    # Bulk GET / SET
+    # ==========================================================
+
+    @classmethod
+    def get_many(
+        cls,
+        texts: List[str],
+        tenant_id: Optional[str] = None
+    ) -> List[Optional[np.ndarray]]:
+        """
+        Looks up many texts under one lock acquisition.
+
+        A tenant's keys all live in one shard, so a batch costs one
+        acquire/release instead of len(texts) of them — the per-call
+        overhead that dominates when a pipeline resolves a request's
+        worth of texts at once.
+        """
+
+        if not cls.ENABLED:
+            return [None] * len(texts)
+
+        keys = [cls._make_key(text, tenant_id) for text in texts]
+        idx = cls._shard_for(tenant_id)
+        shard = cls._shards[idx]
+
+        results: List[Optional[np.ndarray]] = []
+
+        with cls._locks[idx]:
+            for key in keys:
+                item = shard.get(key)
+
+                if item is not None and not cls._is_expired(item[1]):
+                    cls._ticks[idx] += 1
+                    item[2] = cls._ticks[idx]
+                    cls._hits[idx] += 1
+                    cls._tenant_hits[tenant_id] = (
+                        cls._tenant_hits.get(tenant_id, 0) + 1
+                    )
+                    results.append(cls._entry_value(item))
+                    continue
+
+                if item is not None:
+                    cls._delete_entry(idx, key)
+
+                cls._sketches[idx].add(key)
+                cls._misses[idx] += 1
+                cls._tenant_misses[tenant_id] = (
+                    cls._tenant_misses.get(tenant_id, 0) + 1
+                )
+                results.append(None)
+
+        return results
+
+    @classmethod
+    def set_many(
+        cls,
+        items: Dict[str, Union[np.ndarray, List[float]]],
+        tenant_id: Optional[str] = None
+    ) -> None:
+        """
+        Stores many text → embedding pairs under one lock
+        acquisition, with eviction and the memory cap settled once
+        for the whole batch.
+        """
+
+        if not cls.ENABLED or not items:
+            return
+
+        idx = cls._shard_for(tenant_id)
+
+        # All conversion work happens before the lock
+        prepared = [
+            (cls._make_key(text, tenant_id), cls._prepare_value(embedding))
+            for text, embedding in items.items()
+        ]
+
+        with cls._locks[idx]:
+            for key, value in prepared:
+                cls._insert(idx, key, value)
+            cls._enforce_limits(idx)
+
+    # ==========================================================
+    # GET OR COMPUTE (Stampede Protection)
+    # ==========================================================
+
+    @classmethod
+    def get_or_compute(
+        cls,
+        text: str,
+        tenant_id: Optional[str],
+        loader: Callable[[], Union[np.ndarray, List[float]]],
+    ) -> np.ndarray:
+        """
+        Cache-through lookup that coalesces concurrent misses.
+
+        N threads missing on the same uncached text would otherwise
+        fire N embedding-API calls. The first miss installs a Future
+        and runs the loader; every other thread blocks on
+        future.result() and shares the one answer — one API call,
+        one bill.
+        """
+
+        if not cls.ENABLED:
+            return np.asarray(loader(), dtype=np.float32)
+
+        cached = cls.get(text, tenant_id)
+        if cached is not None:
+            return cached
+
+        key = cls._make_key(text, tenant_id)
+        idx = cls._shard_for(tenant_id)
+
+        with cls._locks[idx]:
+            # Re-check under the lock — a leader may have landed the
+            # value between our miss and here
+            item = cls._shards[idx].get(key)
+            if item is not None and not cls._is_expired(item[1]):
+                return cls._entry_value(item)
+
+            future = cls._pending.get(key)
+            if future is None:
+                future = Future()
+                cls._pending[key] = future
+                leader = True
+            else:
+                leader = False
+
+        if not leader:
+            return future.result()
+
+        try:
+            embedding = np.asarray(loader(), dtype=np.float32)
+        except BaseException as exc:
+            # Waiters see the same failure; the key is released so
+            # the next request retries the load
+            future.set_exception(exc)
+            with cls._locks[idx]:
+                cls._pending.pop(key, None)
+            raise
+
+        cls.set(text, embedding, tenant_id)
+        future.set_result(embedding)
+        with cls._locks[idx]:
+            cls._pending.pop(key, None)
+
+        return embedding
+
+    @classmethod
+    def _delete_entry(cls, idx: int, key: Hashable) -> None:
+        """
+        Remove one entry and settle the shard's byte counter.
+        Caller must hold the shard lock.
+        """
+        item = cls._shards[idx].pop(key, None)
+        if item is not None:
+            cls._bytes_used[idx] -= item[3]
+
+    @classmethod
+    def _tenant_gap(cls, tenant_id: Optional[str]) -> float:
+        """
+        Measured hit ratio minus the tenant's target (Max-Min): the
+        larger the gap, the better the tenant can afford an eviction.
+        """
+        hits = cls._tenant_hits.get(tenant_id, 0)
+        total = hits + cls._tenant_misses.get(tenant_id, 0)
+        rate = (hits / total) if total else 0.0
+
+        target = cls.TENANT_TARGETS.get(tenant_id, cls.DEFAULT_TENANT_TARGET)
+        return rate - target
+
+    @classmethod
+    def _evict_lru(cls, idx: int, shard_max: int) -> None:
+        """
+        Drop the shard's least-valuable entries down to its size
+        share. Caller must hold the shard lock.
+
+        Victims are ordered Max-Min first (tenant furthest over its
+        target hit ratio loses entries first), coldest tick second —
+        with one tenant in the shard this degenerates to plain LRU.
+        """
+        shard = cls._shards[idx]
+        overflow = len(shard) - shard_max
+        if overflow <= 0:
+            return
+
+        gaps = {
+            tenant_id: cls._tenant_gap(tenant_id)
+            for tenant_id in {key[0] for key in shard}
+        }
+
+        coldest = heapq.nsmallest(
+            overflow,
+            shard.items(),
+            key=lambda kv: (-gaps[kv[0][0]], kv[1][2]),
+        )
+        for key, _ in coldest:
+            cls._delete_entry(idx, key)
 
     # ==========================================================
     # Expired Cleanup
@@ -134,19 +641,28 @@ class EmbeddingCache:
         """
         Remove expired items manually.
         Returns number removed.
+
+        Pops the expiry heap until the first still-live deadline —
+        O(k log n) for k actually-expired entries, instead of a scan
+        over the whole shard.
         """
         removed = 0
-        now = time.time()
+        now = time.monotonic()
 
-        with cls._lock:
-            keys = [
-                k for k, (_, ts) in cls._cache.items()
-                if (now - ts) > cls.TTL_SECONDS
-            ]
+        for idx in range(cls.SHARD_COUNT):
+            with cls._locks[idx]:
+                shard = cls._shards[idx]
+                heap = cls._expiry_heaps[idx]
 
-            for k in keys:
-                cls._cache.pop(k, None)
-                removed += 1
+                while heap and heap[0][0] <= now:
+                    _, _, key, ts = heapq.heappop(heap)
+
+                    item = shard.get(key)
+                    # Skip stale records: the entry was overwritten
+                    # (newer timestamp) or already evicted
+                    if item is not None and item[1] == ts:
+                        cls._delete_entry(idx, key)
+                        removed += 1
 
         return removed
 
@@ -156,10 +672,16 @@ class EmbeddingCache:
 
     @classmethod
     def clear(cls) -> None:
-        with cls._lock:
-            cls._cache.clear()
-            cls._hits = 0
-            cls._misses = 0
+        for idx in range(cls.SHARD_COUNT):
+            with cls._locks[idx]:
+                cls._shards[idx].clear()
+                cls._expiry_heaps[idx].clear()
+                cls._bytes_used[idx] = 0
+                cls._hits[idx] = 0
+                cls._misses[idx] = 0
+
+        cls._tenant_hits.clear()
+        cls._tenant_misses.clear()
 
     # ==========================================================
     # Stats
@@ -167,21 +689,26 @@ class EmbeddingCache:
 
     @classmethod
     def stats(cls) -> Dict[str, float]:
-        with cls._lock:
-            total = cls._hits + cls._misses
-            hit_ratio = (cls._hits / total) if total > 0 else 0.0
-
-            return {
-                "enabled": cls.ENABLED,
-                "size": len(cls._cache),
-                "max_size": cls.MAX_SIZE,
-                "ttl_seconds": cls.TTL_SECONDS,
-                "hits": cls._hits,
-                "misses": cls._misses,
-                "hit_ratio": round(hit_ratio, 4),
-                "memory_estimate_mb": round(cls._estimate_memory_mb(), 4),
-                "max_memory_mb": cls.MAX_MEMORY_MB,
-            }
+        # Aggregated without taking the shard locks: every counter is
+        # a monotonic int, so a snapshot that's a few operations stale
+        # is fine for monitoring and never stalls the hot path
+        hits = sum(cls._hits)
+        misses = sum(cls._misses)
+        total = hits + misses
+        hit_ratio = (hits / total) if total > 0 else 0.0
+
+        return {
+            "enabled": cls.ENABLED,
+            "size": sum(len(shard) for shard in cls._shards),
+            "max_size": cls.MAX_SIZE,
+            "ttl_seconds": cls.TTL_SECONDS,
+            "shards": cls.SHARD_COUNT,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hit_ratio, 4),
+            "memory_estimate_mb": round(cls._estimate_memory_mb(), 4),
+            "max_memory_mb": cls.MAX_MEMORY_MB,
+        }
 
     # ==========================================================
     # Accurate Memory Estimation
@@ -189,17 +716,9 @@ class EmbeddingCache:
 
     @classmethod
     def _estimate_memory_mb(cls) -> float:
-        total_bytes = 0
-
-        for key, (embedding, _) in cls._cache.items():
-            total_bytes += sys.getsizeof(key)
-
-            # Estimate embedding size properly
-            total_bytes += sys.getsizeof(embedding)
-            for value in embedding:
-                total_bytes += sys.getsizeof(value)
-
-        return total_bytes / (1024 * 1024)
+        # Entry sizes are accounted at insert/evict time, so this is
+        # a SHARD_COUNT-length sum regardless of cache size
+        return sum(cls._bytes_used) / (1024 * 1024)
 
     # ==========================================================
     # Preload Support
@@ -228,6 +747,6 @@ class EmbeddingCache:
         """
         return {
             "status": "enabled" if cls.ENABLED else "disabled",
-            "items": str(len(cls._cache)),
+            "items": str(sum(len(shard) for shard in cls._shards)),
             "memory_mb": str(round(cls._estimate_memory_mb(), 3)),
-        }
\ No newline at end of file
+        }
@@ -0,0 +1,156 @@
+"""
+In-process cache for the pricing_plans table.
+
+Plans change monthly at most, yet every checkout and every subscription
+webhook was issuing its own SELECT. Rows are cached for a short TTL and
+indexed by id, name and stripe_price_id; admin plan edits call
+invalidate() so changes take effect immediately.
+
+Entries are plain snapshots of the row, not ORM instances — a cached
+instance would expire with whichever session loaded it and raise
+DetachedInstanceError on the next request.
+"""
+
+import os
+import time
+from threading import Lock
+from types import SimpleNamespace
+from typing import Optional
+
+from app.models.pricing_plan import PricingPlan
+
+# =====================================================
+# Configuration
+# =====================================================
+
+PLAN_CACHE_TTL_SECONDS = int(os.getenv("PLAN_CACHE_TTL_SECONDS", "300"))
+
+# Columns copied into the cached snapshot
+_PLAN_FIELDS = (
+    "id",
+    "name",
+    "tier",
+    "is_active",
+    "stripe_price_id",
+    "monthly_price",
+    "overage_per_request",
+    "semantic_call_cost",
+    "request_limit",
+    "hard_limit",
+    "rate_limit_per_minute",
+    "features",
+)
+
+_cache: dict = {}
+_lock = Lock()
+
+
+def _snapshot(plan: PricingPlan) -> SimpleNamespace:
+    return SimpleNamespace(**{f: getattr(plan, f) for f in _PLAN_FIELDS})
+
+
+def _get_cached(cache_key) -> Optional[SimpleNamespace]:
+    with _lock:
+        entry = _cache.get(cache_key)
+
+        if entry is None:
+            return None
+
+        snapshot, cached_at = entry
+
+        if time.time() - cached_at > PLAN_CACHE_TTL_SECONDS:
+            del _cache[cache_key]
+            return None
+
+        return snapshot
+
+
+def _store(snapshot: SimpleNamespace) -> None:
+    now = time.time()
+
+    with _lock:
+        # Populate every index so any lookup path hits
+        _cache[("id", snapshot.id)] = (snapshot, now)
+        _cache[("name", snapshot.name)] = (snapshot, now)
+
+        if snapshot.stripe_price_id:
+            _cache[("price", snapshot.stripe_price_id)] = (snapshot, now)
+
+
+# =====================================================
+# Public Lookups
+# =====================================================
+def get_plan_by_name(db, name: str) -> Optional[SimpleNamespace]:
+    """
+    Returns the active plan with this name, from cache when fresh.
+    """
+
+    cached = _get_cached(("name", name))
+    if cached is not None:
+        return cached
+
+    plan = db.query(PricingPlan).filter(
+        PricingPlan.name == name,
+        PricingPlan.is_active == True
+    ).first()
+
+    if plan is None:
+        return None
+
+    snapshot = _snapshot(plan)
+    _store(snapshot)
+    return snapshot
+
+
+def get_plan_by_id(db, plan_id: int) -> Optional[SimpleNamespace]:
+    """
+    Returns the plan row by primary key, from cache when fresh.
+
+    There are only a handful of plans against millions of tenant
+    fetches, so this turns the per-tenant plan JOIN into a dict hit.
+    """
+
+    cached = _get_cached(("id", plan_id))
+    if cached is not None:
+        return cached
+
+    plan = db.query(PricingPlan).filter(
+        PricingPlan.id == plan_id
+    ).first()
+
+    if plan is None:
+        return None
+
+    snapshot = _snapshot(plan)
+    _store(snapshot)
+    return snapshot
+
+
+def get_plan_by_price_id(db, price_id: str) -> Optional[SimpleNamespace]:
+    """
+    Returns the plan backed by this Stripe price, from cache when fresh.
+    """
+
+    cached = _get_cached(("price", price_id))
+    if cached is not None:
+        return cached
+
+    plan = db.query(PricingPlan).filter(
+        PricingPlan.stripe_price_id == price_id
+    ).first()
+
+    if plan is None:
+        return None
+
+    snapshot = _snapshot(plan)
+    _store(snapshot)
+    return snapshot
+
+
+def invalidate() -> None:
+    """
+    Drops all cached plans. Call after any plan create/update/delete.
+    """
+
+    with _lock:
+        _cache.clear()
@@ -1,9 +1,8 @@
 import os
 import stripe
-from dotenv import load_dotenv
+import app.core.env  # noqa: F401
 from typing import Optional, Dict
 
-load_dotenv()
 
 stripe.api_key = os.getenv("STRIPE_SECRET_KEY")
 
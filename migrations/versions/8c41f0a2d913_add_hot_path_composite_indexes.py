@@ -0,0 +1,48 @@
+"""add hot path composite indexes
+
+Revision ID: 8c41f0a2d913
+Revises: 791b2ab61105
+Create Date: 2026-08-27 09:14:02.118342
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision: str = "8c41f0a2d913"
+down_revision: Union[str, Sequence[str], None] = "791b2ab61105"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Composite / partial indexes for the per-tenant hot filters.
+
+    - evaluation_logs(tenant_id, recommendation): lets the dashboard
+      BLOCK/WARN/ALLOW aggregates run as index-only scans.
+    - tenants partial index on the active + not-suspended predicate
+      used by every authenticated request.
+    """
+
+    op.create_index(
+        "idx_tenant_recommendation",
+        "evaluation_logs",
+        ["tenant_id", "recommendation"],
+    )
+
+    op.create_index(
+        "idx_tenants_active_unsuspended",
+        "tenants",
+        ["tenant_id"],
+        postgresql_where=sa.text("is_active AND NOT is_suspended"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+
+    op.drop_index("idx_tenants_active_unsuspended", table_name="tenants")
+    op.drop_index("idx_tenant_recommendation", table_name="evaluation_logs")
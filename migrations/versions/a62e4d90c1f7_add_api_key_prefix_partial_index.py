@@ -0,0 +1,43 @@
+"""add api key prefix partial index
+
+Revision ID: a62e4d90c1f7
+Revises: f19c3b8a57d2
+Create Date: 2026-08-27 12:41:27.502318
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision: str = "a62e4d90c1f7"
+down_revision: Union[str, Sequence[str], None] = "f19c3b8a57d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Partial unique index backing the prefix lookup in auth.
+
+    Only live keys are indexed, so the auth SELECT is a single index
+    scan, and two active keys can never share a prefix.
+    """
+
+    op.create_index(
+        "ix_api_keys_prefix_active",
+        "tenant_api_keys",
+        ["key_prefix"],
+        unique=True,
+        postgresql_where=sa.text("is_active AND NOT is_revoked"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+
+    op.drop_index(
+        "ix_api_keys_prefix_active",
+        table_name="tenant_api_keys",
+    )
@@ -0,0 +1,42 @@
+"""request hash to bytea
+
+Revision ID: a91c5e2d74f8
+Revises: f4b6d81c29e5
+Create Date: 2026-08-27 16:40:12.557736
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision: str = "a91c5e2d74f8"
+down_revision: Union[str, Sequence[str], None] = "f4b6d81c29e5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Store request_hash as raw 32 bytes instead of 64 hex chars.
+
+    Halves the column and the uq_request_hash_tenant index entries —
+    more entries per page for the B-tree probed on every insert.
+    """
+
+    op.execute(
+        "ALTER TABLE evaluation_logs "
+        "ALTER COLUMN request_hash TYPE bytea "
+        "USING decode(request_hash, 'hex')"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+
+    op.execute(
+        "ALTER TABLE evaluation_logs "
+        "ALTER COLUMN request_hash TYPE varchar(64) "
+        "USING encode(request_hash, 'hex')"
+    )
@@ -0,0 +1,44 @@
+"""add embedding cache covering index
+
+Revision ID: b28f7c91e4d3
+Revises: a91c5e2d74f8
+Create Date: 2026-08-27 16:58:33.412059
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision: str = "b28f7c91e4d3"
+down_revision: Union[str, Sequence[str], None] = "a91c5e2d74f8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Covering index for embedding cache lookups.
+
+    The bulk lookup selects (content_hash, embedding); carrying the
+    payload columns in the index leaf lets those queries run as
+    index-only scans — one page read instead of index probe + heap
+    fetch per hit.
+    """
+
+    op.create_index(
+        "idx_embcache_hash_covering",
+        "embedding_cache",
+        ["content_hash"],
+        postgresql_include=["embedding", "model_used"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+
+    op.drop_index(
+        "idx_embcache_hash_covering",
+        table_name="embedding_cache",
+    )
@@ -0,0 +1,37 @@
+"""add daily trend expression index
+
+Revision ID: b7d2e91c4f60
+Revises: 8c41f0a2d913
+Create Date: 2026-08-27 09:41:17.530284
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision: str = "b7d2e91c4f60"
+down_revision: Union[str, Sequence[str], None] = "8c41f0a2d913"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Expression index backing the 7-day trust trend GROUP BY.
+    Matches the date_trunc('day', created_at) bucket used by
+    /stats/trend so the rollup reads from the index.
+    """
+
+    op.create_index(
+        "idx_eval_tenant_day",
+        "evaluation_logs",
+        [sa.text("tenant_id"), sa.text("date_trunc('day', created_at)")],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+
+    op.drop_index("idx_eval_tenant_day", table_name="evaluation_logs")
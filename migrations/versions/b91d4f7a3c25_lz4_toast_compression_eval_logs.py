@@ -0,0 +1,57 @@
+"""lz4 toast compression eval logs
+
+Revision ID: b91d4f7a3c25
+Revises: e48b2c6f91a3
+Create Date: 2026-08-27 18:05:11.482317
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision: str = "b91d4f7a3c25"
+down_revision: Union[str, Sequence[str], None] = "e48b2c6f91a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Wide varlena columns on the insert-heavy table — everything that
+# routinely spills into TOAST
+_WIDE_COLUMNS = (
+    "user_query",
+    "llm_response",
+    "retrieved_context",
+    "score_breakdown",
+    "explanations",
+    "triggered_keywords",
+)
+
+
+def upgrade() -> None:
+    """
+    Switch TOAST compression on evaluation_logs payload columns from
+    pglz to lz4.
+
+    lz4 compresses several times faster than pglz at similar ratios,
+    and every evaluate request inserts a row carrying the full query,
+    response and context — so the compression cost sits directly on
+    the write path. Only newly written values use lz4; existing TOAST
+    data stays pglz and remains readable, no rewrite needed.
+    """
+
+    for col in _WIDE_COLUMNS:
+        op.execute(
+            f"ALTER TABLE evaluation_logs "
+            f"ALTER COLUMN {col} SET COMPRESSION lz4"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+
+    for col in _WIDE_COLUMNS:
+        op.execute(
+            f"ALTER TABLE evaluation_logs "
+            f"ALTER COLUMN {col} SET COMPRESSION pglz"
+        )
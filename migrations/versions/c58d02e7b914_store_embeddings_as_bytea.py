@@ -0,0 +1,49 @@
+"""store embeddings as bytea
+
+Revision ID: c58d02e7b914
+Revises: a62e4d90c1f7
+Create Date: 2026-08-27 16:05:41.118264
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers
+revision: str = "c58d02e7b914"
+down_revision: Union[str, Sequence[str], None] = "a62e4d90c1f7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Switch the embedding column from a JSONB number array to BYTEA
+    holding the int8-quantized vector (one byte per component).
+
+    A 768-dim row shrinks from several KB of JSON to 768 bytes and
+    loads zero-copy via np.frombuffer. The cache is rebuildable, so
+    existing rows are dropped rather than converted.
+    """
+
+    op.execute("TRUNCATE embedding_cache")
+
+    op.drop_column("embedding_cache", "embedding")
+    op.add_column(
+        "embedding_cache",
+        sa.Column("embedding", sa.LargeBinary(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+
+    op.execute("TRUNCATE embedding_cache")
+
+    op.drop_column("embedding_cache", "embedding")
+    op.add_column(
+        "embedding_cache",
+        sa.Column("embedding", postgresql.JSONB(), nullable=False),
+    )
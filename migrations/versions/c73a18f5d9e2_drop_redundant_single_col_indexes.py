@@ -0,0 +1,65 @@
+"""drop redundant single col indexes
+
+Revision ID: c73a18f5d9e2
+Revises: d16e49a8c2f7
+Create Date: 2026-08-27 17:24:48.229501
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision: str = "c73a18f5d9e2"
+down_revision: Union[str, Sequence[str], None] = "d16e49a8c2f7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Drop single-column indexes whose column already leads a
+    composite (or unique) index.
+
+    Postgres serves single-column predicates from a composite's
+    leading column, so these only added write amplification on the
+    evaluation_logs insert path.
+    """
+
+    # evaluation_logs — covered by idx_tenant_*, idx_app_created,
+    # idx_risk_recommendation, idx_trust_score_date
+    op.drop_index("ix_evaluation_logs_tenant_id", table_name="evaluation_logs")
+    op.drop_index("ix_evaluation_logs_app_name", table_name="evaluation_logs")
+    op.drop_index("ix_evaluation_logs_business_risk", table_name="evaluation_logs")
+    op.drop_index("ix_evaluation_logs_trust_score", table_name="evaluation_logs")
+
+    # tenant_api_keys — covered by idx_tenant_env / idx_key_status
+    op.drop_index("ix_tenant_api_keys_tenant_id", table_name="tenant_api_keys")
+
+    # tenants — the unique ix_tenants_tenant_id already serves point
+    # lookups; the (tenant_id, is_active) composite added nothing
+    op.drop_index("idx_tenants_tenant_active", table_name="tenants")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+
+    op.create_index(
+        "idx_tenants_tenant_active", "tenants", ["tenant_id", "is_active"]
+    )
+    op.create_index(
+        "ix_tenant_api_keys_tenant_id", "tenant_api_keys", ["tenant_id"]
+    )
+    op.create_index(
+        "ix_evaluation_logs_trust_score", "evaluation_logs", ["trust_score"]
+    )
+    op.create_index(
+        "ix_evaluation_logs_business_risk", "evaluation_logs", ["business_risk"]
+    )
+    op.create_index(
+        "ix_evaluation_logs_app_name", "evaluation_logs", ["app_name"]
+    )
+    op.create_index(
+        "ix_evaluation_logs_tenant_id", "evaluation_logs", ["tenant_id"]
+    )
@@ -0,0 +1,42 @@
+"""add eval created brin index
+
+Revision ID: d16e49a8c2f7
+Revises: b28f7c91e4d3
+Create Date: 2026-08-27 17:10:02.847613
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision: str = "d16e49a8c2f7"
+down_revision: Union[str, Sequence[str], None] = "b28f7c91e4d3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    BRIN index on created_at for long-range analytics scans.
+
+    evaluation_logs is append-only, so physical row order tracks
+    created_at — BRIN summarizes page ranges in a few KB and the
+    planner picks it for wide date windows in get_summary, leaving
+    the composite B-trees to short per-tenant windows.
+    """
+
+    op.create_index(
+        "idx_eval_created_brin",
+        "evaluation_logs",
+        ["created_at"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": "32"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+
+    op.drop_index("idx_eval_created_brin", table_name="evaluation_logs")
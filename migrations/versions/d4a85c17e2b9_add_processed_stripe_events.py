@@ -0,0 +1,51 @@
+"""add processed stripe events
+
+Revision ID: d4a85c17e2b9
+Revises: b7d2e91c4f60
+Create Date: 2026-08-27 10:22:48.914706
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision: str = "d4a85c17e2b9"
+down_revision: Union[str, Sequence[str], None] = "b7d2e91c4f60"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Idempotency ledger for Stripe webhook deliveries.
+    """
+
+    op.create_table(
+        "processed_stripe_events",
+
+        sa.Column("event_id", sa.String(length=255), primary_key=True),
+
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+        ),
+    )
+
+    op.create_index(
+        "ix_processed_stripe_events_created_at",
+        "processed_stripe_events",
+        ["created_at"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+
+    op.drop_index(
+        "ix_processed_stripe_events_created_at",
+        table_name="processed_stripe_events",
+    )
+    op.drop_table("processed_stripe_events")
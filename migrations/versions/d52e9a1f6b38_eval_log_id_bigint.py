@@ -0,0 +1,46 @@
+"""eval log id bigint
+
+Revision ID: d52e9a1f6b38
+Revises: b91d4f7a3c25
+Create Date: 2026-08-27 18:12:47.905128
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision: str = "d52e9a1f6b38"
+down_revision: Union[str, Sequence[str], None] = "b91d4f7a3c25"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Widen evaluation_logs.id (and its sequence) from int4 to int8.
+
+    An append-only audit table hits the ~2.1B int4 ceiling within the
+    retention window at production volume, and doing this widening
+    later — under load, on a much bigger table — means a full rewrite
+    with the insert path down. Done now while the rewrite is cheap.
+    """
+
+    op.execute(
+        "ALTER TABLE evaluation_logs ALTER COLUMN id TYPE bigint"
+    )
+    op.execute(
+        "ALTER SEQUENCE evaluation_logs_id_seq AS bigint"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+
+    op.execute(
+        "ALTER SEQUENCE evaluation_logs_id_seq AS integer"
+    )
+    op.execute(
+        "ALTER TABLE evaluation_logs ALTER COLUMN id TYPE integer"
+    )
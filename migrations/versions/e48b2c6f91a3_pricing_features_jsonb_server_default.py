@@ -0,0 +1,55 @@
+"""pricing features jsonb server default
+
+Revision ID: e48b2c6f91a3
+Revises: c73a18f5d9e2
+Create Date: 2026-08-27 17:36:20.661903
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision: str = "e48b2c6f91a3"
+down_revision: Union[str, Sequence[str], None] = "c73a18f5d9e2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_DEFAULT_FEATURES = (
+    '\'{"semantic_enabled": true, '
+    '"confidence_layer_enabled": true, '
+    '"advanced_analytics": false, '
+    '"priority_support": false}\'::jsonb'
+)
+
+
+def upgrade() -> None:
+    """
+    Move pricing_plans.features to JSONB with a server-side default.
+
+    JSONB skips the text re-parse on every plan fetch, and the
+    default lives in the database instead of a Python lambda run per
+    insert.
+    """
+
+    op.execute(
+        "ALTER TABLE pricing_plans "
+        "ALTER COLUMN features TYPE jsonb USING features::jsonb"
+    )
+    op.execute(
+        "ALTER TABLE pricing_plans "
+        f"ALTER COLUMN features SET DEFAULT {_DEFAULT_FEATURES}"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+
+    op.execute(
+        "ALTER TABLE pricing_plans ALTER COLUMN features DROP DEFAULT"
+    )
+    op.execute(
+        "ALTER TABLE pricing_plans "
+        "ALTER COLUMN features TYPE json USING features::json"
+    )
@@ -0,0 +1,71 @@
+"""add stripe linkage columns
+
+Revision ID: f19c3b8a57d2
+Revises: d4a85c17e2b9
+Create Date: 2026-08-27 11:05:12.338190
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision: str = "f19c3b8a57d2"
+down_revision: Union[str, Sequence[str], None] = "d4a85c17e2b9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Columns the Stripe integration reads but the schema never gained.
+
+    The unique index on stripe_customer_id also backs the webhook's
+    tenant-by-customer lookup, so every event resolves in one
+    index probe.
+    """
+
+    op.add_column(
+        "tenants",
+        sa.Column("stripe_customer_id", sa.String(length=255), nullable=True),
+    )
+    op.add_column(
+        "tenants",
+        sa.Column("stripe_subscription_id", sa.String(length=255), nullable=True),
+    )
+
+    op.create_index(
+        "ix_tenants_stripe_customer_id",
+        "tenants",
+        ["stripe_customer_id"],
+        unique=True,
+    )
+
+    op.add_column(
+        "pricing_plans",
+        sa.Column("stripe_price_id", sa.String(length=255), nullable=True),
+    )
+
+    op.create_index(
+        "ix_pricing_plans_stripe_price_id",
+        "pricing_plans",
+        ["stripe_price_id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+
+    op.drop_index(
+        "ix_pricing_plans_stripe_price_id",
+        table_name="pricing_plans",
+    )
+    op.drop_column("pricing_plans", "stripe_price_id")
+
+    op.drop_index(
+        "ix_tenants_stripe_customer_id",
+        table_name="tenants",
+    )
+    op.drop_column("tenants", "stripe_subscription_id")
+    op.drop_column("tenants", "stripe_customer_id")
@@ -0,0 +1,59 @@
+"""eval log json to jsonb
+
+Revision ID: f4b6d81c29e5
+Revises: e7a9c34f1b82
+Create Date: 2026-08-27 16:31:55.203187
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision: str = "f4b6d81c29e5"
+down_revision: Union[str, Sequence[str], None] = "e7a9c34f1b82"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_JSON_COLUMNS = (
+    "triggered_keywords",
+    "score_breakdown",
+    "explanations",
+    "retrieved_context",
+)
+
+
+def upgrade() -> None:
+    """
+    Move the evaluation_logs JSON columns to JSONB and add a GIN
+    index for keyword drilldowns.
+
+    JSONB is parsed once at write time instead of on every read,
+    stores smaller, and supports containment indexing.
+    """
+
+    for column in _JSON_COLUMNS:
+        op.execute(
+            f"ALTER TABLE evaluation_logs "
+            f"ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb"
+        )
+
+    op.create_index(
+        "idx_eval_triggered_kw_gin",
+        "evaluation_logs",
+        ["triggered_keywords"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+
+    op.drop_index("idx_eval_triggered_kw_gin", table_name="evaluation_logs")
+
+    for column in _JSON_COLUMNS:
+        op.execute(
+            f"ALTER TABLE evaluation_logs "
+            f"ALTER COLUMN {column} TYPE json USING {column}::json"
+        )